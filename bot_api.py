@@ -3,18 +3,28 @@ Bot API Interface for Poker Tournament
 This defines the interface that all student bots must implement
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, FrozenSet
 from engine.cards import Card
 from engine.poker_game import GameState, PlayerAction
 import logging
 
+# Rank bits of A, 2, 3 and 4, the ace-low straight draw
+_ACE_TO_FOUR = (1 << 14) | (1 << 2) | (1 << 3) | (1 << 4)
+
 
 class PokerBotAPI(ABC):
     """
     Abstract base class that all poker bots must inherit from.
     Students implement the required methods to create their bot strategy.
+    
+    A bot that only reads a few game state fields can list them in game_state_fields
+    (e.g. frozenset({"pot", "current_bet", "to_call"})). get_action is then passed a
+    lightweight named tuple with just those fields instead of a full GameState.
+    Besides the GameState fields, "to_call" (chips needed to call) is available.
     """
     
+    game_state_fields: Optional[FrozenSet[str]] = None  # None: receive the full GameState
+    
     def __init__(self, name: str):
         self.name = name
         self.logger = logging.getLogger(f"bot.{name}")
@@ -117,20 +127,21 @@ class GameInfoAPI:
                 - 'players_after': Number of players acting after this player
                 - 'is_last': True if this player acts last
         """
-        try:
-            position = game_state.active_players.index(player_name)
-            current_pos = game_state.active_players.index(game_state.current_player)
-            
-            # Adjust position relative to current player
-            relative_pos = (position - current_pos) % len(game_state.active_players)
-            
-            return {
-                'position': relative_pos,
-                'players_after': len(game_state.active_players) - relative_pos - 1,
-                'is_last': relative_pos == len(game_state.active_players) - 1
-            }
-        except ValueError:
+        index = game_state.active_index
+        position = index.get(player_name)
+        current_pos = index.get(game_state.current_player)
+        if position is None or current_pos is None:
             return {'position': -1, 'players_after': 0, 'is_last': False}
+        
+        # Adjust position relative to current player
+        num_players = len(index)
+        relative_pos = (position - current_pos) % num_players
+        
+        return {
+            'position': relative_pos,
+            'players_after': num_players - relative_pos - 1,
+            'is_last': relative_pos == num_players - 1
+        }
     
     @staticmethod
     def calculate_bet_amount(current_bet: int, player_current_bet: int) -> int:
@@ -186,6 +197,32 @@ class GameInfoAPI:
         """
         return game_state.player_chips.copy()
     
+    @staticmethod
+    def has_strong_draw(cards: List[Card]) -> bool:
+        """
+        Check for a strong drawing hand: a flush draw (exactly four cards of one suit)
+        or an open-ended straight draw (four consecutive ranks, or A-2-3-4).
+        
+        Args:
+            cards: Hole cards plus community cards
+            
+        Returns:
+            bool: True if the cards hold a strong draw
+        """
+        # One rank bitmask per suit (bit n = rank n) plus their union
+        suit_masks = [0, 0, 0, 0]
+        for card in cards:
+            suit_masks[card.suit_id] |= card.rank_bit
+        ranks = suit_masks[0] | suit_masks[1] | suit_masks[2] | suit_masks[3]
+        
+        for mask in suit_masks:
+            if bin(mask).count('1') == 4:
+                return True
+        
+        if ranks & (ranks >> 1) & (ranks >> 2) & (ranks >> 3):
+            return True
+        return ranks & _ACE_TO_FOUR == _ACE_TO_FOUR
+    
     @staticmethod
     def format_cards(cards: List[Card]) -> str:
         """
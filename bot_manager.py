@@ -2,15 +2,14 @@
 Bot Management System with Timeout and Error Handling
 Loads, manages, and executes student poker bots safely
 """
+import ast
 import importlib.util
 import sys
 import os
 import signal
 import time
 import traceback
-import threading
-import multiprocessing
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Set
 from contextlib import contextmanager
 import logging
 
@@ -56,13 +55,153 @@ def timeout_context(seconds: float):
         yield
 
 
+@contextmanager
+def _no_timeout(seconds: float):
+    """Stand-in for timeout_context when the deadline is enforced elsewhere"""
+    yield
+
+
+def _load_bot_class(file_path: str, bot_name: str) -> type:
+    """Import a bot file and return its PokerBotAPI subclass"""
+    # Create module spec
+    spec = importlib.util.spec_from_file_location(bot_name, file_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load module spec for {os.path.basename(file_path)}")
+    
+    # Load the module
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[bot_name] = module
+    spec.loader.exec_module(module)
+    
+    # Find the bot class
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name)
+        if (isinstance(attr, type) and 
+            issubclass(attr, PokerBotAPI) and 
+            attr != PokerBotAPI):
+            return attr
+    
+    raise ImportError(f"No PokerBotAPI subclass found in {os.path.basename(file_path)}")
+
+
+def _bot_process_main(conn, file_path: str, bot_name: str):
+    """Entry point of an isolated bot process: serve method calls until the pipe closes"""
+    try:
+        bot = _load_bot_class(file_path, bot_name)(bot_name)
+    except Exception as e:
+        conn.send((False, f"{type(e).__name__}: {e}"))
+        return
+    conn.send((True, None))
+    
+    while True:
+        try:
+            method, args = conn.recv()
+        except EOFError:
+            break
+        try:
+            conn.send((True, getattr(bot, method)(*args)))
+        except Exception as e:
+            conn.send((False, f"{type(e).__name__}: {e}"))
+
+
+class ProcessBot:
+    """
+    Runs a bot in its own process so a runaway decision can actually be killed.
+    Exposes the PokerBotAPI methods; each call is one pipe round-trip with a deadline,
+    and a bot that misses it is killed and restarted from a fresh instance.
+    """
+    
+    LOAD_TIMEOUT = 30.0  # seconds allowed for importing and constructing the bot
+    
+    def __init__(self, file_path: str, name: str, timeout: float = 10.0):
+        self.file_path = file_path
+        self.name = name
+        self.timeout = timeout
+        
+        import multiprocessing  # only isolated runs pay for importing it
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        self._process = None
+        self._conn = None
+        self._start()
+    
+    def _start(self):
+        parent_conn, child_conn = self._context.Pipe()
+        self._process = self._context.Process(target=_bot_process_main,
+                                              args=(child_conn, self.file_path, self.name),
+                                              daemon=True)
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+        
+        if not self._conn.poll(self.LOAD_TIMEOUT):
+            self.close()
+            raise ImportError(f"Bot {self.name} did not start within {self.LOAD_TIMEOUT}s")
+        ok, error = self._conn.recv()
+        if not ok:
+            self.close()
+            raise ImportError(error)
+    
+    def _call(self, method: str, *args):
+        self._conn.send((method, args))
+        if not self._conn.poll(self.timeout):
+            self.restart()
+            raise TimeoutException("Bot action timed out")
+        try:
+            ok, result = self._conn.recv()
+        except EOFError:
+            self.restart()
+            raise BotError("Bot process exited unexpectedly")
+        if not ok:
+            raise BotError(result)
+        return result
+    
+    def restart(self):
+        """Kill the bot process and start a fresh one"""
+        self.close()
+        self._start()
+    
+    def close(self):
+        """Stop the bot process"""
+        if self._process is not None and self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+        if self._conn is not None:
+            self._conn.close()
+        self._process = None
+        self._conn = None
+    
+    def get_action(self, game_state: GameState, hole_cards: List[Card], 
+                   legal_actions: List[PlayerAction], min_bet: int, max_bet: int) -> tuple:
+        return self._call('get_action', game_state, hole_cards, legal_actions, min_bet, max_bet)
+    
+    def hand_complete(self, game_state: GameState, hand_result: Dict[str, Any]):
+        return self._call('hand_complete', game_state, hand_result)
+    
+    def tournament_start(self, players: List[str], starting_chips: int):
+        return self._call('tournament_start', players, starting_chips)
+    
+    def tournament_end(self, final_standings: List[Tuple[str, int, int]]):
+        return self._call('tournament_end', final_standings)
+
+
 class BotWrapper:
     """Wrapper for a poker bot that handles execution and errors"""
     
-    def __init__(self, name: str, bot_instance: PokerBotAPI, timeout: float = 10.0):
+    def __init__(self, name: str, bot_instance: PokerBotAPI, timeout: float = 10.0,
+                 trusted: bool = False):
         self.name = name
         self.bot = bot_instance
         self.timeout = timeout
+        self.trusted = trusted
+        # Let the engine see which game state fields the wrapped bot reads
+        self.game_state_fields = getattr(bot_instance, 'game_state_fields', None)
+        # Isolated bots enforce their own deadline and trusted bots are not timed,
+        # so neither needs SIGALRM set up around each call
+        if trusted or isinstance(bot_instance, ProcessBot):
+            self._timeout_context = _no_timeout
+        else:
+            self._timeout_context = timeout_context
         self.error_count = 0
         self.timeout_count = 0
         self.max_errors = 5
@@ -81,99 +220,93 @@ class BotWrapper:
         Get action from bot with timeout and error handling
         """
         if self.is_disqualified():
-            self.logger.warning(f"Bot {self.name} is disqualified, folding automatically")
+            self.logger.warning("Bot %s is disqualified, folding automatically", self.name)
             return PlayerAction.FOLD, 0
         
         try:
-            with timeout_context(self.timeout):
+            with self._timeout_context(self.timeout):
                 action, amount = self.bot.get_action(game_state, hole_cards, legal_actions, min_bet, max_bet)
                 
                 # Validate action
                 if not isinstance(action, PlayerAction):
                     raise BotError(f"Invalid action type: {type(action)}")
                 
-                if not isinstance(amount, (int, float)):
-                    raise BotError(f"Invalid amount type: {type(amount)}")
-                
-                amount = int(amount)
+                # Plain ints (the usual case) skip the generic check and conversion
+                if type(amount) is not int:
+                    if not isinstance(amount, (int, float)):
+                        raise BotError(f"Invalid amount type: {type(amount)}")
+                    amount = int(amount)
                 
                 # Ensure action is legal
                 if action not in legal_actions:
-                    self.logger.warning(f"Bot {self.name} attempted illegal action {action}, folding instead")
+                    self.logger.warning("Bot %s attempted illegal action %s, folding instead", self.name, action)
                     return PlayerAction.FOLD, 0
                 
                 # Validate amount for raises
                 if action == PlayerAction.RAISE:
                     if amount < min_bet or amount > max_bet:
-                        self.logger.warning(f"Bot {self.name} attempted invalid raise amount {amount}, folding instead")
+                        self.logger.warning("Bot %s attempted invalid raise amount %s, folding instead", self.name, amount)
                         return PlayerAction.FOLD, 0
                 
                 return action, amount
                 
         except TimeoutException:
             self.timeout_count += 1
-            self.logger.warning(f"Bot {self.name} timed out ({self.timeout_count}/{self.max_timeouts})")
+            self.logger.warning("Bot %s timed out (%s/%s)", self.name, self.timeout_count, self.max_timeouts)
             return PlayerAction.FOLD, 0
             
         except Exception as e:
             self.error_count += 1
-            self.logger.error(f"Bot {self.name} error ({self.error_count}/{self.max_errors}): {str(e)}")
-            self.logger.debug(traceback.format_exc())
+            self.logger.error("Bot %s error (%s/%s): %s", self.name, self.error_count, self.max_errors, e)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(traceback.format_exc())
             return PlayerAction.FOLD, 0
     
-    def hand_complete(self, game_state: GameState, hand_result: Dict[str, Any]):
-        """Notify bot of hand completion with error handling"""
+    def _guarded(self, label: str, fn, *args):
+        """Call a notification method under the time limit, counting and logging timeouts and errors"""
         try:
-            with timeout_context(self.timeout):
-                self.bot.hand_complete(game_state, hand_result)
+            with self._timeout_context(self.timeout):
+                fn(*args)
         except TimeoutException:
             self.timeout_count += 1
-            self.logger.warning(f"Bot {self.name} timed out during hand_complete ({self.timeout_count}/{self.max_timeouts})")
+            self.logger.warning("Bot %s timed out during %s (%s/%s)", self.name, label, self.timeout_count, self.max_timeouts)
         except Exception as e:
             self.error_count += 1
-            self.logger.error(f"Bot {self.name} error in hand_complete ({self.error_count}/{self.max_errors}): {str(e)}")
+            self.logger.error("Bot %s error in %s (%s/%s): %s", self.name, label, self.error_count, self.max_errors, e)
+    
+    def hand_complete(self, game_state: GameState, hand_result: Dict[str, Any]):
+        """Notify bot of hand completion with error handling"""
+        self._guarded('hand_complete', self.bot.hand_complete, game_state, hand_result)
     
     def tournament_start(self, players: List[str], starting_chips: int):
         """Notify bot of tournament start with error handling"""
-        try:
-            with timeout_context(self.timeout):
-                self.bot.tournament_start(players, starting_chips)
-        except TimeoutException:
-            self.timeout_count += 1
-            self.logger.warning(f"Bot {self.name} timed out during tournament_start ({self.timeout_count}/{self.max_timeouts})")
-        except Exception as e:
-            self.error_count += 1
-            self.logger.error(f"Bot {self.name} error in tournament_start ({self.error_count}/{self.max_errors}): {str(e)}")
+        self._guarded('tournament_start', self.bot.tournament_start, players, starting_chips)
     
     def tournament_end(self, final_standings: List[Tuple[str, int, int]]):
         """Notify bot of tournament end with error handling"""
-        try:
-            with timeout_context(self.timeout):
-                self.bot.tournament_end(final_standings)
-        except TimeoutException:
-            self.timeout_count += 1
-            self.logger.warning(f"Bot {self.name} timed out during tournament_end ({self.timeout_count}/{self.max_timeouts})")
-        except Exception as e:
-            self.error_count += 1
-            self.logger.error(f"Bot {self.name} error in tournament_end ({self.error_count}/{self.max_errors}): {str(e)}")
+        self._guarded('tournament_end', self.bot.tournament_end, final_standings)
 
 
 class BotManager:
     """Manages loading and execution of all poker bots"""
     
-    def __init__(self, players_directory: str = "players", timeout: float = 10.0):
+    def __init__(self, players_directory: str = "players", timeout: float = 10.0,
+                 isolate_bots: bool = False):
         self.players_directory = players_directory
         self.timeout = timeout
+        self.isolate_bots = isolate_bots  # run each bot in its own killable process
         self.bots: Dict[str, BotWrapper] = {}
         self.failed_bots: List[str] = []
         
         self.logger = logging.getLogger("bot_manager")
         
-    def load_all_bots(self) -> List[str]:
+    def load_all_bots(self, trusted_bots: Optional[Set[str]] = None) -> List[str]:
         """
         Load all bot files from the players directory
+        Bots named in trusted_bots run without a time limit
         Returns list of successfully loaded bot names
         """
+        trusted_bots = trusted_bots or set()
         if not os.path.exists(self.players_directory):
             self.logger.error(f"Players directory '{self.players_directory}' does not exist")
             return []
@@ -189,7 +322,8 @@ class BotManager:
             try:
                 bot_instance = self._load_bot_from_file(bot_file, bot_name)
                 if bot_instance:
-                    wrapper = BotWrapper(bot_name, bot_instance, self.timeout)
+                    wrapper = BotWrapper(bot_name, bot_instance, self.timeout,
+                                         trusted=bot_name in trusted_bots)
                     self.bots[bot_name] = wrapper
                     loaded_bots.append(bot_name)
                     self.logger.info(f"Successfully loaded bot: {bot_name}")
@@ -200,7 +334,8 @@ class BotManager:
             except Exception as e:
                 self.failed_bots.append(bot_name)
                 self.logger.error(f"Error loading bot {bot_name}: {str(e)}")
-                self.logger.debug(traceback.format_exc())
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(traceback.format_exc())
         
         self.logger.info(f"Loaded {len(loaded_bots)} bots successfully")
         if self.failed_bots:
@@ -212,31 +347,11 @@ class BotManager:
         """Load a single bot from a Python file"""
         file_path = os.path.join(self.players_directory, filename)
         
-        # Create module spec
-        spec = importlib.util.spec_from_file_location(bot_name, file_path)
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Could not load module spec for {filename}")
-        
-        # Load the module
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[bot_name] = module
-        spec.loader.exec_module(module)
-        
-        # Find the bot class
-        bot_class = None
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
-            if (isinstance(attr, type) and 
-                issubclass(attr, PokerBotAPI) and 
-                attr != PokerBotAPI):
-                bot_class = attr
-                break
-        
-        if bot_class is None:
-            raise ImportError(f"No PokerBotAPI subclass found in {filename}")
+        if self.isolate_bots:
+            return ProcessBot(file_path, bot_name, self.timeout)
         
         # Instantiate the bot
-        return bot_class(bot_name)
+        return _load_bot_class(file_path, bot_name)(bot_name)
     
     def get_bot(self, bot_name: str) -> Optional[BotWrapper]:
         """Get a bot wrapper by name"""
@@ -272,14 +387,14 @@ class BotManager:
     
     def cleanup(self):
         """Clean up resources"""
-        # Remove modules from sys.modules to allow reloading
-        modules_to_remove = []
-        for module_name in sys.modules:
-            if module_name in self.bots:
-                modules_to_remove.append(module_name)
+        for wrapper in self.bots.values():
+            if isinstance(wrapper.bot, ProcessBot):
+                wrapper.bot.close()
         
-        for module_name in modules_to_remove:
-            del sys.modules[module_name]
+        # Remove bot modules from sys.modules so the next tournament loads them fresh
+        # (bots may keep state in module or class globals)
+        for bot_name in self.bots:
+            sys.modules.pop(bot_name, None)
         
         self.bots.clear()
         self.failed_bots.clear()
@@ -306,6 +421,59 @@ def validate_bot_file(file_path: str) -> Tuple[bool, str]:
     Validate that a bot file contains a proper PokerBotAPI implementation
     Returns (is_valid: bool, error_message: str)
     """
+    try:
+        with open(file_path, encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=file_path)
+    except Exception as e:
+        return False, f"Error validating bot file: {str(e)}"
+    
+    # Inspect the source without running it: find a class deriving from PokerBotAPI,
+    # directly or through another class defined in the same file
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    
+    def base_names(node: ast.ClassDef) -> List[str]:
+        return [base.id if isinstance(base, ast.Name) else getattr(base, 'attr', None) for base in node.bases]
+    
+    def derives_from_api(node: ast.ClassDef, seen: set) -> bool:
+        for base_name in base_names(node):
+            if base_name == 'PokerBotAPI':
+                return True
+            if base_name in classes and base_name not in seen:
+                seen.add(base_name)
+                if derives_from_api(classes[base_name], seen):
+                    return True
+        return False
+    
+    def defined_methods(node: ast.ClassDef, seen: set) -> Set[str]:
+        """Methods defined on the class or on its bases from this file"""
+        names = {item.name for item in node.body
+                 if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))}
+        for base_name in base_names(node):
+            if base_name in classes and base_name not in seen:
+                seen.add(base_name)
+                names |= defined_methods(classes[base_name], seen)
+        return names
+    
+    bot_classes = [node for node in classes.values() if derives_from_api(node, set())]
+    if not bot_classes:
+        # Aliased imports or dynamically built classes: only importing can tell
+        return _validate_bot_file_by_import(file_path)
+    
+    # Check required methods (abstract on PokerBotAPI, so the bot's own classes must define
+    # them). A shared base class may leave some to its subclasses, so one complete class is enough.
+    required_methods = ['get_action', 'hand_complete']
+    missing = None
+    for bot_class in bot_classes:
+        defined = defined_methods(bot_class, {bot_class.name})
+        missing = next((method for method in required_methods if method not in defined), None)
+        if missing is None:
+            return True, "Valid bot file"
+    
+    return False, f"Missing required method: {missing}"
+
+
+def _validate_bot_file_by_import(file_path: str) -> Tuple[bool, str]:
+    """Fallback for validate_bot_file: import the module and inspect its classes"""
     try:
         # Try to load and inspect the module
         spec = importlib.util.spec_from_file_location("temp_bot", file_path)
@@ -328,10 +496,10 @@ def validate_bot_file(file_path: str) -> Tuple[bool, str]:
         if bot_class is None:
             return False, "No PokerBotAPI subclass found"
         
-        # Check required methods
+        # Check required methods (still abstract if no class below PokerBotAPI defines them)
         required_methods = ['get_action', 'hand_complete']
         for method in required_methods:
-            if not hasattr(bot_class, method):
+            if method in getattr(bot_class, '__abstractmethods__', ()):
                 return False, f"Missing required method: {method}"
         
         return True, "Valid bot file"
@@ -2,20 +2,23 @@
 Poker card and deck management system
 """
 import random
-from enum import Enum
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
+from enum import IntEnum
+from typing import Dict, List, Tuple, Optional
 from itertools import combinations
+from functools import lru_cache
 
 
-class Suit(Enum):
-    HEARTS = "♥"
-    DIAMONDS = "♦"
-    CLUBS = "♣"
-    SPADES = "♠"
+class Suit(IntEnum):
+    HEARTS = 0
+    DIAMONDS = 1
+    CLUBS = 2
+    SPADES = 3
 
 
-class Rank(Enum):
+SUIT_GLYPHS = {Suit.HEARTS: "♥", Suit.DIAMONDS: "♦", Suit.CLUBS: "♣", Suit.SPADES: "♠"}
+
+
+class Rank(IntEnum):
     TWO = 2
     THREE = 3
     FOUR = 4
@@ -31,18 +34,39 @@ class Rank(Enum):
     ACE = 14
 
 
-@dataclass
+# Cactus Kev card encoding (one 32-bit int per card):
+#   bits 16-28: one bit per rank (2..A)
+#   bits 12-15: one bit per suit (0x1000 << suit)
+#   bits  8-11: rank index (0 = deuce .. 12 = ace)
+#   bits  0-7:  rank prime (2, 3, 5, ... 41)
+_RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+_RANK_STR = {
+    Rank.TWO: "2", Rank.THREE: "3", Rank.FOUR: "4", Rank.FIVE: "5",
+    Rank.SIX: "6", Rank.SEVEN: "7", Rank.EIGHT: "8", Rank.NINE: "9",
+    Rank.TEN: "10", Rank.JACK: "J", Rank.QUEEN: "Q", Rank.KING: "K", Rank.ACE: "A"
+}
+
+
 class Card:
-    rank: Rank
-    suit: Suit
+    """
+    A playing card; `code` is its packed Cactus Kev integer used by HandEvaluator
+    and `bit` its own bit out of 52, so a set of cards packs into one int.
+    `suit_id` and `rank_bit` (1 << rank) are plain ints for per-suit rank bitmasks.
+    """
+    __slots__ = ('rank', 'suit', 'code', 'bit', 'suit_id', 'rank_bit')
+
+    def __init__(self, rank: Rank, suit: Suit):
+        self.rank = rank
+        self.suit = suit
+        r = rank - 2
+        self.code = (1 << (16 + r)) | (0x1000 << suit) | (r << 8) | _RANK_PRIMES[r]
+        self.bit = 1 << (r * 4 + suit)
+        self.suit_id = int(suit)
+        self.rank_bit = 1 << rank
 
     def __str__(self) -> str:
-        rank_str = {
-            Rank.TWO: "2", Rank.THREE: "3", Rank.FOUR: "4", Rank.FIVE: "5",
-            Rank.SIX: "6", Rank.SEVEN: "7", Rank.EIGHT: "8", Rank.NINE: "9",
-            Rank.TEN: "10", Rank.JACK: "J", Rank.QUEEN: "Q", Rank.KING: "K", Rank.ACE: "A"
-        }
-        return f"{rank_str[self.rank]}{self.suit.value}"
+        return f"{_RANK_STR[self.rank]}{SUIT_GLYPHS[self.suit]}"
 
     def __repr__(self) -> str:
         return self.__str__()
@@ -50,10 +74,14 @@ class Card:
     def __eq__(self, other) -> bool:
         if not isinstance(other, Card):
             return False
-        return self.rank == other.rank and self.suit == other.suit
+        return self.code == other.code
 
     def __hash__(self) -> int:
-        return hash((self.rank, self.suit))
+        return hash(self.code)
+
+
+# Cards are never mutated, so every deck shares these 52 instances
+_DECK_TEMPLATE: List[Card] = [Card(rank, suit) for rank in Rank for suit in Suit]
 
 
 class Deck:
@@ -62,8 +90,8 @@ class Deck:
         self.reset()
 
     def reset(self):
-        """Reset deck with all 52 cards"""
-        self.cards = [Card(rank, suit) for rank in Rank for suit in Suit]
+        """Reset deck with all 52 cards, refilling the existing list"""
+        self.cards[:] = _DECK_TEMPLATE
 
     def shuffle(self):
         """Shuffle the deck"""
@@ -75,11 +103,233 @@ class Deck:
             return self.cards.pop()
         return None
 
+    def deal_many(self, n: int) -> List[Card]:
+        """Deal n cards from the top of the deck, in the order deal_card would"""
+        if n <= 0:
+            return []
+        cards = self.cards[:-n - 1:-1]
+        del self.cards[-n:]
+        return cards
+
     def cards_remaining(self) -> int:
         """Get number of cards remaining in deck"""
         return len(self.cards)
 
 
+# The ten straights as 13-bit rank masks, lowest (wheel) first
+_STRAIGHT_MASKS = [0b1000000001111] + [0b11111 << i for i in range(9)]
+
+
+def _build_lookup_tables():
+    """
+    Enumerate all 7462 distinct 5-card hand classes from weakest to strongest.
+    Returns (flush_table, unique5_table, product_table, class_info) where the
+    strength of a hand is its 1-based position in that ordering.
+    """
+    flush_table = [0] * (0x1F00 + 1)
+    unique5_table = [0] * (0x1F00 + 1)
+    product_table = {}
+    class_info = [None]
+
+    def mask_of(ranks):
+        mask = 0
+        for r in ranks:
+            mask |= 1 << ((r if r != 1 else 14) - 2)  # 1 is the ace of a wheel
+        return mask
+
+    def product_of(counts):
+        product = 1
+        for r, n in counts:
+            product *= _RANK_PRIMES[r - 2] ** n
+        return product
+
+    ranks_desc = list(range(14, 1, -1))
+    distinct = sorted(
+        (tuple(c) for c in combinations(ranks_desc, 5) if mask_of(c) not in _STRAIGHT_MASKS)
+    )
+    straights = [tuple(range(5 + i, i, -1)) for i in range(10)]  # (5,4,3,2,1) .. (14,..,10)
+
+    def add(hand_type, tiebreakers, table=None, key=None):
+        class_info.append((hand_type, tiebreakers))
+        if table is not None:
+            table[key] = len(class_info) - 1
+
+    for ranks in distinct:
+        add('high_card', ranks, unique5_table, mask_of(ranks))
+    pairs = sorted(
+        (p,) + k for p in range(2, 15) for k in combinations([r for r in ranks_desc if r != p], 3)
+    )
+    for p, *kickers in pairs:
+        add('pair', (p, *kickers), product_table, product_of([(p, 2)] + [(k, 1) for k in kickers]))
+    two_pairs = sorted(
+        (hp, lp, k) for hp in range(2, 15) for lp in range(2, hp) for k in range(2, 15) if k not in (hp, lp)
+    )
+    for hp, lp, k in two_pairs:
+        add('two_pair', (hp, lp, k), product_table, product_of([(hp, 2), (lp, 2), (k, 1)]))
+    trips = sorted(
+        (t,) + k for t in range(2, 15) for k in combinations([r for r in ranks_desc if r != t], 2)
+    )
+    for t, *kickers in trips:
+        add('three_of_a_kind', (t, *kickers), product_table, product_of([(t, 3)] + [(k, 1) for k in kickers]))
+    for ranks in straights:
+        add('straight', ranks, unique5_table, mask_of(ranks))
+    for ranks in distinct:
+        add('flush', ranks, flush_table, mask_of(ranks))
+    for t, p in sorted((t, p) for t in range(2, 15) for p in range(2, 15) if t != p):
+        add('full_house', (t, p), product_table, product_of([(t, 3), (p, 2)]))
+    for q, k in sorted((q, k) for q in range(2, 15) for k in range(2, 15) if q != k):
+        add('four_of_a_kind', (q, k), product_table, product_of([(q, 4), (k, 1)]))
+    for ranks in straights:
+        hand_type = 'royal_flush' if ranks[0] == 14 else 'straight_flush'
+        add(hand_type, ranks, flush_table, mask_of(ranks))
+
+    return flush_table, unique5_table, product_table, class_info
+
+
+_FLUSH_TABLE, _UNIQUE5_TABLE, _PRODUCT_TABLE, _CLASS_INFO = _build_lookup_tables()
+
+
+def _eval5(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+    """Strength (1 = worst, 7462 = royal flush) of five Cactus Kev encoded cards"""
+    q = (c1 | c2 | c3 | c4 | c5) >> 16
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return _FLUSH_TABLE[q]
+    strength = _UNIQUE5_TABLE[q]
+    if strength:
+        return strength
+    return _PRODUCT_TABLE[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+
+
+# SWAR constants for _eval_codes: rank counts live in one nibble per rank index,
+# suit counts in the nibbles selected by the one-hot suit bits (4, 8, 16 and 32)
+_RANK_NIBBLES = 0x1111111111111
+_SUIT_PLUS_3 = (3 << 4) | (3 << 8) | (3 << 16) | (3 << 32)
+_SUIT_BIT_3 = (8 << 4) | (8 << 8) | (8 << 16) | (8 << 32)
+
+# Non-flush strengths keyed by rank-count nibbles; at most ~75k distinct 5-7 card
+# rank multisets exist, so repeated showdowns and Monte Carlo run-outs hit this.
+_RANK_COUNT_CACHE: Dict[int, int] = {}
+
+
+def _top_bits(mask: int, n: int) -> int:
+    """Keep only the n highest set bits of mask"""
+    top = 0
+    for _ in range(n):
+        bit = 1 << (mask.bit_length() - 1)
+        top |= bit
+        mask ^= bit
+    return top
+
+
+def _straight_key(rank_mask: int) -> int:
+    """13-bit mask of the highest straight in rank_mask, or 0 if there is none"""
+    wheel = (rank_mask << 1) | (rank_mask >> 12)  # bit 0 is a low ace
+    run = wheel & (wheel >> 1) & (wheel >> 2) & (wheel >> 3) & (wheel >> 4)
+    if run:
+        return _STRAIGHT_MASKS[run.bit_length() - 1]
+    return 0
+
+
+# 5-card index sets for 5, 6 and 7 cards, in itertools.combinations order
+_COMBO_INDICES = {n: tuple(combinations(range(n), 5)) for n in (5, 6, 7)}
+
+
+def _eval_codes(codes: List[int]) -> int:
+    """
+    Strength of the best 5-card hand in 5 to 7 encoded cards, computed directly
+    from rank/suit bitmasks instead of evaluating every 5-card combination.
+    """
+    if len(codes) > 7:
+        return max(_eval5(*combo) for combo in combinations(codes, 5))
+
+    rank_mask = 0
+    counts = 0
+    suit_counts = 0
+    for c in codes:
+        rank_mask |= c >> 16
+        counts += 1 << (((c >> 8) & 0xF) << 2)
+        suit_counts += 1 << (((c >> 12) & 0xF) << 2)
+
+    flush = (suit_counts + _SUIT_PLUS_3) & _SUIT_BIT_3
+    if flush:
+        # With at most 7 cards, quads or a full house cannot coexist with a flush
+        suit_bit = (flush.bit_length() - 4) >> 2
+        suit_mask = 0
+        for c in codes:
+            if (c >> 12) & 0xF == suit_bit:
+                suit_mask |= c >> 16
+        return _FLUSH_TABLE[_straight_key(suit_mask) or _top_bits(suit_mask, 5)]
+
+    # Without a flush only the rank multiset matters, and `counts` encodes it exactly
+    strength = _RANK_COUNT_CACHE.get(counts)
+    if strength is None:
+        strength = _RANK_COUNT_CACHE[counts] = _eval_rank_counts(rank_mask, counts)
+    return strength
+
+
+def _eval_rank_counts(rank_mask: int, counts: int) -> int:
+    """Strength of the best non-flush hand given the rank mask and per-rank count nibbles"""
+    primes = _RANK_PRIMES
+    quads = counts & (_RANK_NIBBLES << 2)
+    trips = counts & (counts >> 1) & _RANK_NIBBLES
+    pairs = (counts >> 1) & ~counts & _RANK_NIBBLES
+
+    if quads:
+        q = (quads.bit_length() - 1) >> 2
+        kicker = (rank_mask & ~(1 << q)).bit_length() - 1
+        return _PRODUCT_TABLE[primes[q] ** 4 * primes[kicker]]
+    if trips:
+        t = (trips.bit_length() - 1) >> 2
+        others = (trips ^ (1 << (t << 2))) | pairs
+        if others:
+            p = (others.bit_length() - 1) >> 2
+            return _PRODUCT_TABLE[primes[t] ** 3 * primes[p] ** 2]
+
+    straight = _straight_key(rank_mask)
+    if straight:
+        return _UNIQUE5_TABLE[straight]
+
+    if trips:
+        key = primes[t] ** 3
+        kickers = 2
+        rest = rank_mask ^ (1 << t)
+    elif pairs:
+        hp = (pairs.bit_length() - 1) >> 2
+        pairs ^= 1 << (hp << 2)
+        if pairs:
+            lp = (pairs.bit_length() - 1) >> 2
+            key = primes[hp] ** 2 * primes[lp] ** 2
+            kickers = 1
+            rest = rank_mask ^ (1 << hp) ^ (1 << lp)
+        else:
+            key = primes[hp] ** 2
+            kickers = 3
+            rest = rank_mask ^ (1 << hp)
+    else:
+        return _UNIQUE5_TABLE[_top_bits(rank_mask, 5)]
+
+    for _ in range(kickers):
+        k = rest.bit_length() - 1
+        key *= primes[k]
+        rest ^= 1 << k
+    return _PRODUCT_TABLE[key]
+
+
+# Cactus Kev code of the card owning each of the 52 Card.bit positions
+_CODE_OF_BIT = {card.bit.bit_length() - 1: card.code for card in _DECK_TEMPLATE}
+
+
+@lru_cache(maxsize=1 << 16)
+def _strength_of_card_mask(card_mask: int) -> int:
+    """_eval_codes for a set of cards given as OR-ed Card.bit values"""
+    codes = []
+    while card_mask:
+        low = card_mask & -card_mask
+        codes.append(_CODE_OF_BIT[low.bit_length() - 1])
+        card_mask ^= low
+    return _eval_codes(codes)
+
+
 class HandEvaluator:
     """Evaluates poker hands and determines winners"""
 
@@ -96,6 +346,10 @@ class HandEvaluator:
         'royal_flush': 10
     }
 
+    # Lowest hand_strength of each hand type, so "pair or better" is
+    # hand_strength(cards) >= STRENGTH_FLOORS['pair'] without naming the hand
+    STRENGTH_FLOORS = {_CLASS_INFO[strength][0]: strength for strength in range(len(_CLASS_INFO) - 1, 0, -1)}
+
     @staticmethod
     def evaluate_hand(cards: List[Card]) -> Tuple[str, List[int]]:
         """
@@ -106,75 +360,43 @@ class HandEvaluator:
         if len(cards) != 5:
             raise ValueError("Hand must contain exactly 5 cards")
 
-        # Sort cards by rank (highest first)
-        sorted_cards = sorted(cards, key=lambda x: x.rank.value, reverse=True)
-        ranks = [card.rank.value for card in sorted_cards]
-        suits = [card.suit for card in sorted_cards]
-
-        # Check for flush
-        is_flush = len(set(suits)) == 1
-
-        # Check for straight
-        is_straight = HandEvaluator._is_straight(ranks)
-
-        # Count ranks
-        rank_counts = {}
-        for rank in ranks:
-            rank_counts[rank] = rank_counts.get(rank, 0) + 1
-
-        # Sort by count, then by rank
-        count_groups = {}
-        for rank, count in rank_counts.items():
-            if count not in count_groups:
-                count_groups[count] = []
-            count_groups[count].append(rank)
-
-        # Sort each group by rank (highest first)
-        for count in count_groups:
-            count_groups[count].sort(reverse=True)
-
-        # Determine hand type
-        counts = sorted(rank_counts.values(), reverse=True)
-
-        if is_straight and is_flush:
-            if ranks[0] == Rank.ACE.value and ranks[1] == Rank.KING.value:
-                return 'royal_flush', ranks
-            return 'straight_flush', ranks
-        elif counts[0] == 4:
-            return 'four_of_a_kind', [count_groups[4][0], count_groups[1][0]]
-        elif counts == [3, 2]:
-            return 'full_house', [count_groups[3][0], count_groups[2][0]]
-        elif is_flush:
-            return 'flush', ranks
-        elif is_straight:
-            if ranks == [14, 5, 4, 3, 2]: # Ace-low straight
-                return 'straight', [5, 4, 3, 2, 1]
-            return 'straight', ranks
-        elif counts[0] == 3:
-            return 'three_of_a_kind', [count_groups[3][0]] + sorted(count_groups[1], reverse=True)
-        elif counts == [2, 2, 1]:
-            pairs = sorted(count_groups[2], reverse=True)
-            return 'two_pair', pairs + [count_groups[1][0]]
-        elif counts[0] == 2:
-            return 'pair', [count_groups[2][0]] + sorted(count_groups[1], reverse=True)
-        else:
-            return 'high_card', ranks
+        c1, c2, c3, c4, c5 = cards
+        hand_type, tiebreakers = _CLASS_INFO[_eval5(c1.code, c2.code, c3.code, c4.code, c5.code)]
+        return hand_type, list(tiebreakers)
 
     @staticmethod
-    def _is_straight(ranks: List[int]) -> bool:
-        """Check if ranks form a straight"""
-        # Handle ace-low straight (A-2-3-4-5)
-        if sorted(ranks) == [2, 3, 4, 5, 14]:
-            return True
-        
-        unique_ranks = sorted(list(set(ranks)), reverse=True)
-        if len(unique_ranks) < 5:
-            return False
+    def hand_strength(all_cards: List[Card]) -> int:
+        """
+        Strength of the best 5-card hand from a list of cards.
+        Higher is better; equal strengths are exact ties.
+        """
+        if len(all_cards) < 5:
+            raise ValueError("Must have at least 5 cards to evaluate.")
+
+        return _eval_codes([c.code for c in all_cards])
+
+    @staticmethod
+    def cached_strength(all_cards: List[Card]) -> int:
+        """
+        hand_strength memoized on the set of cards, for callers that re-evaluate the
+        same hole cards and board (e.g. a bot acting several times on one street).
+        The cache is shared process-wide and keeps the 65536 most recent card sets.
+        """
+        if len(all_cards) < 5:
+            raise ValueError("Must have at least 5 cards to evaluate.")
 
-        for i in range(len(unique_ranks) - 4):
-            if unique_ranks[i] - unique_ranks[i+4] == 4:
-                return True
-        return False
+        card_mask = 0
+        for card in all_cards:
+            card_mask |= card.bit
+        return _strength_of_card_mask(card_mask)
+
+    @staticmethod
+    def codes_strength(codes: List[int]) -> int:
+        """hand_strength for cards already reduced to their packed `Card.code` integers"""
+        if len(codes) < 5:
+            raise ValueError("Must have at least 5 cards to evaluate.")
+
+        return _eval_codes(codes)
 
     @staticmethod
     def evaluate_best_hand(all_cards: List[Card]) -> Tuple[str, List[int], List[Card]]:
@@ -185,33 +407,87 @@ class HandEvaluator:
         if len(all_cards) < 5:
             raise ValueError("Must have at least 5 cards to evaluate.")
 
-        best_hand_combination = None
-        best_hand_type = ''
-        best_tiebreakers = []
-        best_rank = -1
-
-        for hand_combination in combinations(all_cards, 5):
-            hand_list = list(hand_combination)
-            hand_type, tiebreakers = HandEvaluator.evaluate_hand(hand_list)
-            rank = HandEvaluator.HAND_RANKINGS[hand_type]
-
-            if rank > best_rank:
-                best_rank = rank
-                best_hand_type = hand_type
-                best_tiebreakers = tiebreakers
-                best_hand_combination = hand_list
-            elif rank == best_rank:
-                # Compare tiebreakers for hands of the same rank
-                for i in range(len(tiebreakers)):
-                    if tiebreakers[i] > best_tiebreakers[i]:
-                        best_hand_type = hand_type
-                        best_tiebreakers = tiebreakers
-                        best_hand_combination = hand_list
-                        break
-                    elif tiebreakers[i] < best_tiebreakers[i]:
-                        break
-        
-        return best_hand_type, best_tiebreakers, best_hand_combination
+        return HandEvaluator.describe_strength(all_cards, _eval_codes([c.code for c in all_cards]))
+
+    @staticmethod
+    def describe_strength(all_cards: List[Card], best_strength: int) -> Tuple[str, List[int], List[Card]]:
+        """
+        evaluate_best_hand for cards whose strength is already known (e.g. from a showdown),
+        so only the search for the five cards making the hand is done.
+        """
+        codes = [c.code for c in all_cards]
+        # Only the cards making the hand still need a combination search
+        index_sets = _COMBO_INDICES.get(len(codes)) or combinations(range(len(codes)), 5)
+        for a, b, c, d, e in index_sets:
+            if _eval5(codes[a], codes[b], codes[c], codes[d], codes[e]) == best_strength:
+                break
+
+        hand_type, tiebreakers = _CLASS_INFO[best_strength]
+        return hand_type, list(tiebreakers), [all_cards[a], all_cards[b], all_cards[c], all_cards[d], all_cards[e]]
+
+    @staticmethod
+    def evaluate_best_hand_batch(hole_cards: List[Card], boards: List[List[Card]]) -> List[int]:
+        """
+        Hand strength of the same hole cards on many boards (e.g. Monte Carlo run-outs).
+        The hole cards are encoded once; returns one strength per board.
+        """
+        hole_codes = [c.code for c in hole_cards]
+        strengths = []
+        for board in boards:
+            strengths.append(_eval_codes(hole_codes + [c.code for c in board]))
+        return strengths
+
+    @staticmethod
+    def evaluate_many(hole_cards_list: List[List[Card]], community_cards: List[Card]) -> List[int]:
+        """
+        Hand strength of several players' hole cards on one shared board (e.g. a showdown).
+        The board is encoded once; returns one strength per player.
+        """
+        board_codes = [c.code for c in community_cards]
+        return [_eval_codes([c.code for c in hole_cards] + board_codes) for hole_cards in hole_cards_list]
+
+    @staticmethod
+    def estimate_equity(hole_cards: List[Card], community_cards: List[Card], num_opponents: int = 1,
+                        num_simulations: int = 200, rng: Optional[random.Random] = None) -> float:
+        """
+        Monte Carlo share of the pot won by hole_cards against num_opponents random hands.
+        Each run-out draws the rest of the board and the opponents' cards from the unseen
+        cards in one sample; ties count as a split. Returns a value between 0 and 1.
+        An opt-in helper for bots: each run-out costs up to one hand evaluation per player,
+        so keep num_simulations small inside get_action (200 run-outs give a standard
+        error of at most 3.5 points of equity).
+        """
+        if num_opponents <= 0:
+            return 1.0
+        sample = (rng or random).sample
+        hole_codes = [c.code for c in hole_cards]
+        board_codes = [c.code for c in community_cards]
+        seen = set(hole_codes + board_codes)
+        unseen = [card.code for card in _DECK_TEMPLATE if card.code not in seen]
+        board_needed = 5 - len(board_codes)
+        draw_count = board_needed + 2 * num_opponents
+        # With the board complete our hand never changes, so it is evaluated once
+        river_strength = _eval_codes(hole_codes + board_codes) if board_needed == 0 else 0
+
+        total = 0.0
+        for _ in range(num_simulations):
+            drawn = sample(unseen, draw_count)
+            if board_needed:
+                board = board_codes + drawn[:board_needed]
+                mine = _eval_codes(hole_codes + board)
+            else:
+                board = board_codes
+                mine = river_strength
+            tied = 1
+            for i in range(board_needed, draw_count, 2):
+                theirs = _eval_codes(drawn[i:i + 2] + board)
+                if theirs > mine:
+                    break
+                if theirs == mine:
+                    tied += 1
+            else:
+                total += 1.0 / tied
+        return total / num_simulations if num_simulations > 0 else 0.0
 
     @staticmethod
     def get_winners(player_hands: List[Tuple[str, List[Card]]]) -> List[str]:
@@ -223,42 +499,7 @@ class HandEvaluator:
         if not player_hands:
             return []
 
-        best_hands = {}  # player_id -> (hand_type, tiebreakers)
-
-        for player_id, all_cards in player_hands:
-            hand_type, tiebreakers, _ = HandEvaluator.evaluate_best_hand(all_cards)
-            best_hands[player_id] = (hand_type, tiebreakers)
-
-        winners = []
-        best_hand_so_far = None
-
-        for player_id, hand_info in best_hands.items():
-            if not best_hand_so_far:
-                best_hand_so_far = hand_info
-                winners = [player_id]
-                continue
-
-            hand_rank = HandEvaluator.HAND_RANKINGS[hand_info[0]]
-            best_rank = HandEvaluator.HAND_RANKINGS[best_hand_so_far[0]]
-
-            if hand_rank > best_rank:
-                best_hand_so_far = hand_info
-                winners = [player_id]
-            elif hand_rank == best_rank:
-                # Same hand type, compare tiebreakers
-                tiebreakers = hand_info[1]
-                best_tiebreakers = best_hand_so_far[1]
-                is_tie = True
-                for i in range(len(tiebreakers)):
-                    if tiebreakers[i] > best_tiebreakers[i]:
-                        best_hand_so_far = hand_info
-                        winners = [player_id]
-                        is_tie = False
-                        break
-                    elif tiebreakers[i] < best_tiebreakers[i]:
-                        is_tie = False
-                        break
-                if is_tie:
-                    winners.append(player_id)
-        
-        return winners
\ No newline at end of file
+        strengths = [HandEvaluator.hand_strength(all_cards) for _, all_cards in player_hands]
+        best_strength = max(strengths)
+        return [player_id for (player_id, _), strength in zip(player_hands, strengths)
+                if strength == best_strength]
@@ -1,5 +1,8 @@
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple, Mapping, Sequence, FrozenSet
+from types import MappingProxyType
+from collections import namedtuple
+from dataclasses import dataclass, field, replace
+from functools import cached_property, lru_cache
 from enum import Enum
 import logging
 
@@ -9,6 +12,10 @@ from .cards import Card, Deck, HandEvaluator
 @dataclass
 class PlayerHand:
     cards: List[Card]
+    codes: Tuple[int, ...] = field(init=False, repr=False, compare=False)  # packed Card.code values
+    
+    def __post_init__(self):
+        self.codes = tuple(card.code for card in self.cards)
 
 class PlayerAction(Enum):
     FOLD = 0
@@ -17,20 +24,82 @@ class PlayerAction(Enum):
     RAISE = 3
     ALL_IN = 4
 
+# Legal action list for each bitmask of PlayerAction values (bit n set = value n legal)
+_LEGAL_ACTIONS_BY_MASK = tuple(tuple(action for action in PlayerAction if mask >> action.value & 1)
+                               for mask in range(1 << len(PlayerAction)))
+
+# Betting rounds in order, with the banner logged at the start of each
+BETTING_ROUNDS = (("preflop", "PRE-FLOP"), ("flop", "FLOP"), ("turn", "TURN"), ("river", "RIVER"))
+
 @dataclass
 class GameState:
+    """
+    What a bot sees when asked to act. player_chips and player_bets are read-only
+    views of the live game and active_players is a tuple, so no dict copies are made per action.
+    The engine reuses one instance for a whole betting round, updating it before each action,
+    so treat it as read-only and use snapshot() to keep a copy.
+    """
     pot: int
     community_cards: List[Card]
     current_bet: int
-    player_chips: Dict[str, int]
-    player_bets: Dict[str, int]
-    active_players: List[str]
+    player_chips: Mapping[str, int]
+    player_bets: Mapping[str, int]
+    active_players: Sequence[str]
     current_player: str
     round_name: str
     min_bet: int
     min_raise: int
     big_blind: int
     small_blind: int
+    
+    @cached_property
+    def active_index(self) -> Dict[str, int]:
+        """Position of each active player in active_players, built on first use"""
+        return {player: i for i, player in enumerate(self.active_players)}
+    
+    def snapshot(self) -> 'GameState':
+        """Copy detached from the live game, for bots that keep game states between actions"""
+        return replace(self, community_cards=list(self.community_cards),
+                       player_chips=dict(self.player_chips), player_bets=dict(self.player_bets))
+    
+    def __getstate__(self):
+        # Mapping proxies cannot be pickled (e.g. for process-isolated bots), so send copies
+        state = self.__dict__.copy()
+        state['player_chips'] = dict(self.player_chips)
+        state['player_bets'] = dict(self.player_bets)
+        return state
+
+# How each field a bot may request through game_state_fields is read off the game;
+# to_call is an extra derived field, the amount the acting player needs to call
+_STATE_VIEW_GETTERS = {
+    'pot': lambda game, player, min_bet: game.pot,
+    'community_cards': lambda game, player, min_bet: game.community_cards.copy(),
+    'current_bet': lambda game, player, min_bet: game.current_bet,
+    'player_chips': lambda game, player, min_bet: MappingProxyType(game.player_chips),
+    'player_bets': lambda game, player, min_bet: MappingProxyType(game.player_bets),
+    'active_players': lambda game, player, min_bet: tuple(game.active_players),
+    'current_player': lambda game, player, min_bet: player,
+    'round_name': lambda game, player, min_bet: game.round_name,
+    'min_bet': lambda game, player, min_bet: min_bet,
+    'min_raise': lambda game, player, min_bet: game.min_raise,
+    'big_blind': lambda game, player, min_bet: game.big_blind,
+    'small_blind': lambda game, player, min_bet: game.small_blind,
+    'to_call': lambda game, player, min_bet: game.current_bet - game.player_bets[player],
+}
+
+@lru_cache(maxsize=None)
+def game_state_view(fields: FrozenSet[str]):
+    """
+    namedtuple class holding only the requested game state fields, paired with their getters.
+    Returns None (meaning: send the full GameState) if any field is unknown.
+    """
+    unknown = set(fields) - _STATE_VIEW_GETTERS.keys()
+    if unknown:
+        logging.getLogger(__name__).warning(
+            "Unknown game_state_fields %s, sending the full GameState instead", sorted(unknown))
+        return None
+    names = tuple(sorted(fields))
+    return namedtuple('GameStateView', names), tuple(_STATE_VIEW_GETTERS[name] for name in names)
 
 class PokerGame:
     """Manages a single hand of Texas Hold'em poker"""
@@ -38,6 +107,13 @@ class PokerGame:
     def __init__(self, players: Dict[str, any], starting_chips: int = 1000, 
                  small_blind: int = 10, big_blind: int = 20, dealer_button_index: int = 0):
         self.player_bots = players
+        # Bots that declare game_state_fields are sent a small view with just those fields
+        self._state_views = {}
+        for player, bot in players.items():
+            fields = getattr(bot, 'game_state_fields', None)
+            view = game_state_view(frozenset(fields)) if fields else None
+            if view is not None:
+                self._state_views[player] = view
         self.player_ids = list(players.keys())
         self.starting_chips = starting_chips
         self.small_blind = small_blind
@@ -47,9 +123,15 @@ class PokerGame:
         self.deck = Deck()
         self.community_cards: List[Card] = []
         self.player_hands: Dict[str, PlayerHand] = {}
+        self.hand_strengths: Dict[str, int] = {}  # showdown strength per player, filled by determine_winners
         self.player_chips: Dict[str, int] = {player: starting_chips for player in self.player_ids}
+        # Template for the per-hand/per-round zeroed dicts; copying it skips re-hashing every name
+        self._zero_per_player: Dict[str, int] = dict.fromkeys(self.player_ids, 0)
         self.player_bets: Dict[str, int] = {player: 0 for player in self.player_ids}
         self.active_players: List[str] = self.player_ids.copy()
+        # Seat bitmask mirroring active_players (bit i = player_ids[i] still in the hand)
+        self._seat_of: Dict[str, int] = {player: i for i, player in enumerate(self.player_ids)}
+        self.alive_mask = (1 << len(self.player_ids)) - 1
         self.folded_players: List[str] = []
         self.total_pot_contributions: Dict[str, int] = {player: 0 for player in self.player_ids}
         
@@ -58,45 +140,37 @@ class PokerGame:
         self.current_bet = 0
         self.dealer_button = dealer_button_index
         self.round_name = "preflop"
-        self.players_acted = set()
+        self._acted_mask = 0    # seats that have acted since the last bet or raise
+        self._all_in_mask = 0   # seats with no chips left this hand
+        self._dealer_active_index: Optional[int] = None  # dealer's slot in active_players this hand
+        self._round_state: Optional[GameState] = None  # GameState reused within a betting round
 
         # Logging
         self.logger = logging.getLogger(__name__)
+        self._log_info = self.logger.isEnabledFor(logging.INFO)  # refreshed each hand
+        self._log_debug = self.logger.isEnabledFor(logging.DEBUG)  # per-action trace
 
     def play_hand(self) -> Dict[str, int]:
         """Plays a single hand of poker, returns chips distribution"""
+        self._log_info = self.logger.isEnabledFor(logging.INFO)
+        self._log_debug = self.logger.isEnabledFor(logging.DEBUG)
         self._start_hand()
 
-        # Pre-flop betting
-        if len(self.active_players) > 1:
-            self.logger.info("\n--- PRE-FLOP BETTING ---")
-            self._run_betting_round()
-            self._log_round_summary()
-
-        # Flop
-        if len(self.active_players) > 1:
-            self.advance_to_next_round()
-            self.logger.info("\n--- FLOP BETTING ---")
-            self._run_betting_round()
-            self._log_round_summary()
-
-        # Turn
-        if len(self.active_players) > 1:
-            self.advance_to_next_round()
-            self.logger.info("\n--- TURN BETTING ---")
-            self._run_betting_round()
-            self._log_round_summary()
-
-        # River
-        if len(self.active_players) > 1:
-            self.advance_to_next_round()
-            self.logger.info("\n--- RIVER BETTING ---")
+        # Betting rounds; each street after pre-flop deals its cards first
+        for round_name, banner in BETTING_ROUNDS:
+            if len(self.active_players) <= 1:
+                break
+            if round_name != "preflop":
+                self.advance_to_next_round()
+            if self._log_info:
+                self.logger.info(f"\n--- {banner} BETTING ---")
             self._run_betting_round()
             self._log_round_summary()
 
         # Showdown
         if len(self.active_players) > 1:
-            self.logger.info("\n--- SHOWDOWN ---")
+            if self._log_info:
+                self.logger.info("\n--- SHOWDOWN ---")
             winners = self.determine_winners()
             self._distribute_pot(winners)
         else:
@@ -115,31 +189,59 @@ class PokerGame:
         self.deal_hole_cards()
         self.post_blinds()
         
-        self.logger.info(f"\n{'='*30}\n--- NEW HAND ---")
-        self.logger.info(f"Dealer: {self.player_ids[self.dealer_button]}")
-        for p_id in self.active_players:
-            self.logger.info(f"{p_id} has {self.player_hands[p_id]} (chips: {self.player_chips[p_id]})")
+        if self._log_info:
+            self.logger.info(f"\n{'='*30}\n--- NEW HAND ---")
+            self.logger.info(f"Dealer: {self.player_ids[self.dealer_button]}")
+            for p_id in self.active_players:
+                self.logger.info(f"{p_id} has {self.player_hands[p_id]} (chips: {self.player_chips[p_id]})")
     
     def reset_hand(self):
-        """Reset for a new hand"""
-        self.deck = Deck()
+        """Reset for a new hand, clearing the previous hand's containers in place"""
+        self.deck.reset()
         self.deck.shuffle()
-        self.community_cards = []
-        self.player_hands = {}
-        self.active_players = [p for p in self.player_ids if self.player_chips[p] > 0]
-        self.player_bets = {player: 0 for player in self.player_ids}
-        self.total_pot_contributions = {player: 0 for player in self.player_ids}
-        self.folded_players = []
+        self._round_state = None
+        self.community_cards.clear()
+        self.player_hands.clear()
+        self.hand_strengths.clear()
+        self.active_players.clear()
+        self.alive_mask = 0
+        for seat, player in enumerate(self.player_ids):
+            if self.player_chips[player] > 0:
+                self.active_players.append(player)
+                self.alive_mask |= 1 << seat
+        self.player_bets.update(self._zero_per_player)
+        self.total_pot_contributions.update(self._zero_per_player)
+        self.folded_players.clear()
+        self._all_in_mask = 0
+        self._dealer_active_index = None
         self.pot = 0
         self.current_bet = self.big_blind
         self.min_raise = self.big_blind
         self.round_name = "preflop"
     
+    def reset_for_next_hand(self, player_chips: Optional[Dict[str, int]] = None,
+                            small_blind: Optional[int] = None, big_blind: Optional[int] = None,
+                            dealer_button_index: Optional[int] = None):
+        """
+        Prepare this game to play another hand with the same players, instead of building
+        a new PokerGame. Stacks, blinds and the button are only changed when given; the
+        per-hand state is cleared in place by play_hand.
+        """
+        if player_chips is not None:
+            self.player_chips.update(player_chips)
+        if small_blind is not None:
+            self.small_blind = small_blind
+        if big_blind is not None:
+            self.big_blind = big_blind
+        if dealer_button_index is not None:
+            self.dealer_button = dealer_button_index
+    
     def deal_hole_cards(self):
         """Deal 2 cards to each active player"""
-        for player in self.active_players:
-            cards = [self.deck.deal_card() for _ in range(2)]
-            self.player_hands[player] = PlayerHand(cards)
+        # One slice for the whole table; player i gets the same two cards as dealing one by one
+        cards = self.deck.deal_many(2 * len(self.active_players))
+        for i, player in enumerate(self.active_players):
+            self.player_hands[player] = PlayerHand(cards[2 * i:2 * i + 2])
     
     def post_blinds(self):
         """Post small and big blinds"""
@@ -147,103 +249,172 @@ class PokerGame:
             return
         
         # Determine the players who post blinds relative to the dealer
-        # Find the index of the current dealer within the active players list
+        dealer_active_index = self._dealer_active_index = self._locate_dealer()
+        if dealer_active_index is None:
+            return # No active dealer found (e.g., all players eliminated)
+        
+        # Small blind is left of the dealer (heads-up: the dealer), big blind is left of the small blind
+        active_players = self.active_players
+        num_active = len(active_players)
+        small_blind_index = dealer_active_index if num_active == 2 else dealer_active_index + 1
+        small_blind_player = active_players[small_blind_index % num_active]
+        big_blind_player = active_players[(small_blind_index + 1) % num_active]
+        
+        player_chips = self.player_chips
+        posted = []
+        for blind_player, blind in ((small_blind_player, self.small_blind), (big_blind_player, self.big_blind)):
+            chips = player_chips[blind_player]
+            amount = blind if blind < chips else chips
+            self.player_bets[blind_player] = amount
+            self.total_pot_contributions[blind_player] += amount
+            player_chips[blind_player] = chips - amount
+            if amount == chips:
+                self._all_in_mask |= 1 << self._seat_of[blind_player]
+            posted.append(amount)
+        small_blind_amount, big_blind_amount = posted
+        self.pot += small_blind_amount + big_blind_amount
+        
+        if self._log_info:
+            self.logger.info(f"{small_blind_player} posts small blind: {small_blind_amount}")
+            self.logger.info(f"{big_blind_player} posts big blind: {big_blind_amount}")
+
+    def _locate_dealer(self) -> Optional[int]:
+        """Index of the current dealer within the active players list, or None if nobody is active"""
         try:
-            dealer_active_index = self.active_players.index(self.player_ids[self.dealer_button])
+            return self.active_players.index(self.player_ids[self.dealer_button])
         except ValueError:
             # Dealer might have been eliminated, find next active player as nominal dealer
             for i in range(len(self.player_ids)):
                 potential_dealer_index = (self.dealer_button + i) % len(self.player_ids)
                 potential_dealer = self.player_ids[potential_dealer_index]
-                if potential_dealer in self.active_players:
+                if self._is_active(potential_dealer):
                     self.dealer_button = potential_dealer_index # Update actual dealer button
-                    dealer_active_index = self.active_players.index(potential_dealer)
-                    break
-            else: # Should not happen if len(self.active_players) >= 1
-                return # No active dealer found (e.g., all players eliminated)
-        
-        if len(self.active_players) == 2:
-            # Heads-up: Dealer is small blind, non-dealer is big blind
-            small_blind_player = self.active_players[dealer_active_index]
-            big_blind_player = self.active_players[(dealer_active_index + 1) % 2]
-        else:
-            # Normal play: Small blind is left of dealer, big blind is left of small blind
-            small_blind_player = self.active_players[(dealer_active_index + 1) % len(self.active_players)]
-            big_blind_player = self.active_players[(dealer_active_index + 2) % len(self.active_players)]
-        
-        # Post small blind
-        small_blind_amount = min(self.small_blind, self.player_chips[small_blind_player])
-        self.player_bets[small_blind_player] = small_blind_amount
-        self.player_chips[small_blind_player] -= small_blind_amount
-        self.pot += small_blind_amount
-        
-        # Post big blind
-        big_blind_amount = min(self.big_blind, self.player_chips[big_blind_player])
-        self.player_bets[big_blind_player] = big_blind_amount
-        self.player_chips[big_blind_player] -= big_blind_amount
-        self.pot += big_blind_amount
-        
-        self.logger.info(f"{small_blind_player} posts small blind: {small_blind_amount}")
-        self.logger.info(f"{big_blind_player} posts big blind: {big_blind_amount}")
+                    return self.active_players.index(potential_dealer)
+            return None
 
     def _run_betting_round(self):
+        if len(self.active_players) == 2:
+            self._run_betting_round_hu()
+            return
         self._start_betting_round()
         
+        # Bound once: none of these are rebound while the round runs
+        active_players = self.active_players
+        player_chips = self.player_chips
+        player_bets = self.player_bets
+        state_views = self._state_views
+        
         while not self.is_betting_round_complete():
-            player_id = self.get_current_player()
-            if not player_id:
+            if not active_players:
                 break
+            player_id = active_players[self.current_player_index % len(active_players)]
+            chips = player_chips[player_id]
             
             # Skip players who are all-in
-            if self.player_chips[player_id] == 0:
+            if chips == 0:
                 self.advance_to_next_player()
                 continue
             
-            bot = self.player_bots[player_id]
-            game_state = self.get_game_state()
-            player_hand = self.get_player_hand(player_id)
-            legal_actions = self.get_legal_actions(game_state, player_id)
-            min_bet = game_state.min_bet
-            max_bet = self.player_chips[player_id] + self.player_bets[player_id]
-
-            action, amount = bot.get_action(game_state, player_hand.cards, legal_actions, min_bet, max_bet)
+            # Per-turn quantities, computed once and shared by the state, legal actions and checks
+            bet = player_bets[player_id]
+            current_bet = self.current_bet
+            min_bet = current_bet + self.min_raise
+            max_bet = chips + bet
+            view = state_views.get(player_id)
+            if view is None:
+                game_state = self._game_state_for(player_id, min_bet)
+            else:
+                view_type, getters = view
+                game_state = view_type._make([getter(self, player_id, min_bet) for getter in getters])
+            legal_actions = self._legal_actions(chips, current_bet - bet)
+
+            action, amount = self.player_bots[player_id].get_action(
+                game_state, self.player_hands[player_id].cards, legal_actions, min_bet, max_bet)
             
-            self.process_action(player_id, action, amount)
+            # An action picked from legal_actions (with an in-range raise) needs no re-validation
+            if action in legal_actions and (action != PlayerAction.RAISE or
+                                            (min_bet <= amount <= max_bet and amount > current_bet)):
+                self._process_trusted(player_id, action, amount)
+            else:
+                self.process_action(player_id, action, amount)
             self.advance_to_next_player()
 
+    def _run_betting_round_hu(self):
+        """Heads-up betting round: the two seats alternate on a 0/1 toggle instead of modulo indexing"""
+        self._start_betting_round()
+        
+        active_players = self.active_players
+        player_chips = self.player_chips
+        player_bets = self.player_bets
+        state_views = self._state_views
+        seats = (active_players[0], active_players[1])
+        turn = self.current_player_index
+        
+        # Any fold leaves a single player and ends the round
+        while len(active_players) == 2:
+            # Round is complete once both live stacks have acted (see is_betting_round_complete)
+            need = self.alive_mask & ~self._all_in_mask
+            if self._acted_mask & need == need:
+                break
+            current_bet = self.current_bet
+            
+            player_id = seats[turn]
+            chips = player_chips[player_id]
+            if chips > 0:
+                bet = player_bets[player_id]
+                min_bet = current_bet + self.min_raise
+                max_bet = chips + bet
+                view = state_views.get(player_id)
+                if view is None:
+                    game_state = self._game_state_for(player_id, min_bet)
+                else:
+                    view_type, getters = view
+                    game_state = view_type._make([getter(self, player_id, min_bet) for getter in getters])
+                legal_actions = self._legal_actions(chips, current_bet - bet)
+
+                action, amount = self.player_bots[player_id].get_action(
+                    game_state, self.player_hands[player_id].cards, legal_actions, min_bet, max_bet)
+                
+                if action in legal_actions and (action != PlayerAction.RAISE or
+                                                (min_bet <= amount <= max_bet and amount > current_bet)):
+                    self._process_trusted(player_id, action, amount)
+                else:
+                    self.process_action(player_id, action, amount)
+            
+            turn ^= 1
+            self.current_player_index = turn
+
     def _start_betting_round(self):
         """Resets betting state for a new round."""
-        self.players_acted = set()
-        # Find the index of the current dealer within the active players list
-        try:
-            dealer_active_index = self.active_players.index(self.player_ids[self.dealer_button])
-        except ValueError:
-            # Dealer might have been eliminated, find next active player as nominal dealer
-            for i in range(len(self.player_ids)):
-                potential_dealer_index = (self.dealer_button + i) % len(self.player_ids)
-                potential_dealer = self.player_ids[potential_dealer_index]
-                if potential_dealer in self.active_players:
-                    self.dealer_button = potential_dealer_index # Update actual dealer button
-                    dealer_active_index = self.active_players.index(potential_dealer)
-                    break
-            else: # Should not happen if len(self.active_players) >= 1
-                dealer_active_index = 0 # Default to first active player if no valid dealer is found (shouldn't happen with >=1 active)
-
+        self._acted_mask = 0
+        self._round_state = None  # built on the round's first get_game_state
+        # Reuse the dealer position found when blinds were posted unless the dealer has since folded
+        if self._dealer_active_index is None:
+            self._dealer_active_index = self._locate_dealer()
+        dealer_active_index = self._dealer_active_index
+        if dealer_active_index is None:
+            dealer_active_index = 0 # Default to first active player if no valid dealer is found (shouldn't happen with >=1 active)
+
+        num_active = len(self.active_players)
         if self.round_name == "preflop":
-            if len(self.active_players) == 2:
+            if num_active == 2:
                 # Heads-up: Dealer (SB) acts first pre-flop
                 self.current_player_index = dealer_active_index
             else:
                 # 3+ players: UTG acts first (Left of BB)
-                self.current_player_index = (dealer_active_index + 3) % len(self.active_players)
+                self.current_player_index = (dealer_active_index + 3) % num_active
             self.min_raise = self.big_blind
         else:
-            self.current_player_index = (dealer_active_index + 1) % len(self.active_players)
+            self.current_player_index = (dealer_active_index + 1) % num_active
             self.current_bet = 0
             self.min_raise = self.big_blind
-            for p in self.player_ids:
-                self.player_bets[p] = 0
+            self.player_bets.update(self._zero_per_player)
         
+    def _is_active(self, player: str) -> bool:
+        """Whether player is still in the hand, via the seat bitmask instead of a list scan"""
+        seat = self._seat_of.get(player)
+        return seat is not None and (self.alive_mask >> seat) & 1 == 1
+
     def get_current_player(self) -> str:
         """Get the current player to act"""
         if not self.active_players:
@@ -252,20 +423,39 @@ class PokerGame:
     
     def get_game_state(self) -> GameState:
         """Get the current game state visible to players"""
-        return GameState(
-            pot=self.pot,
-            community_cards=self.community_cards.copy(),
-            current_bet=self.current_bet,
-            player_chips=self.player_chips.copy(),
-            player_bets=self.player_bets.copy(),
-            active_players=self.active_players.copy(),
-            current_player=self.get_current_player(),
-            round_name=self.round_name,
-            min_bet=self.current_bet + self.min_raise,
-            min_raise=self.min_raise,
-            big_blind=self.big_blind,
-            small_blind=self.small_blind
-        )
+        return self._game_state_for(self.get_current_player(), self.current_bet + self.min_raise)
+    
+    def _game_state_for(self, current_player: str, min_bet: int) -> GameState:
+        """get_game_state with the acting player and min bet the betting loop already knows"""
+        state = self._round_state
+        if state is None:
+            state = self._round_state = GameState(
+                pot=self.pot,
+                community_cards=self.community_cards.copy(),
+                current_bet=self.current_bet,
+                player_chips=MappingProxyType(self.player_chips),
+                player_bets=MappingProxyType(self.player_bets),
+                active_players=tuple(self.active_players),
+                current_player=current_player,
+                round_name=self.round_name,
+                min_bet=min_bet,
+                min_raise=self.min_raise,
+                big_blind=self.big_blind,
+                small_blind=self.small_blind
+            )
+            return state
+        
+        # Same round: the board, blinds and live chip/bet views are unchanged, patch the rest
+        state.pot = self.pot
+        state.current_bet = self.current_bet
+        state.current_player = current_player
+        state.min_bet = min_bet
+        state.min_raise = self.min_raise
+        if len(state.active_players) != len(self.active_players):
+            # Someone folded since the last action
+            state.active_players = tuple(self.active_players)
+            state.__dict__.pop('active_index', None)
+        return state
     
     def get_player_hand(self, player: str) -> Optional[PlayerHand]:
         """Get a player's hole cards"""
@@ -291,9 +481,15 @@ class PokerGame:
         if player_name != game_state.current_player:
             return False
         
-        player_chips = game_state.player_chips[player_name]
-        player_bet = game_state.player_bets[player_name]
-        to_call = game_state.current_bet - player_bet
+        return self._is_action_valid(action, amount, game_state.player_chips[player_name],
+                                     game_state.player_bets[player_name],
+                                     game_state.current_bet, game_state.min_bet)
+    
+    @staticmethod
+    def _is_action_valid(action: PlayerAction, amount: int, player_chips: int, player_bet: int,
+                         current_bet: int, min_bet: int) -> bool:
+        """Rules behind validate_action, on plain values so the engine can skip building a GameState"""
+        to_call = current_bet - player_bet
         
         if action == PlayerAction.FOLD:
             return True
@@ -302,10 +498,9 @@ class PokerGame:
         elif action == PlayerAction.CALL:
             return to_call > 0 and player_chips >= to_call
         elif action == PlayerAction.RAISE:
-            min_raise = game_state.min_bet
-            return (amount >= min_raise and 
+            return (amount >= min_bet and 
                     player_chips >= (amount - player_bet) and
-                    amount > game_state.current_bet)
+                    amount > current_bet)
         elif action == PlayerAction.ALL_IN:
             return player_chips > 0
         
@@ -313,78 +508,110 @@ class PokerGame:
 
     def process_action(self, player: str, action: PlayerAction, amount: int = 0):
         """Process a player's action"""
-        if not self.validate_action(action, amount, self.get_game_state(), player):
+        if (not self._is_active(player) or player != self.get_current_player() or
+                not self._is_action_valid(action, amount, self.player_chips[player], self.player_bets[player],
+                                          self.current_bet, self.current_bet + self.min_raise)):
             # Default to fold if action is invalid
-            self.logger.warning(f"Bot {player} attempted illegal action {action.name}, folding.")
+            self.logger.warning("Bot %s attempted illegal action %s, folding.", player, action.name)
             action = PlayerAction.FOLD
             amount = 0
         
-        self.players_acted.add(player)
+        self._process_trusted(player, action, amount)
+    
+    def _process_trusted(self, player: str, action: PlayerAction, amount: int = 0):
+        """Apply an action already known to be legal for the player to act"""
+        seat_bit = 1 << self._seat_of[player]
+        self._acted_mask |= seat_bit
         player_bet = self.player_bets[player]
         to_call = self.current_bet - player_bet
         
         if action == PlayerAction.FOLD:
             self.folded_players.append(player)
-            if player in self.active_players:
-                self.active_players.remove(player)
+            if self._is_active(player):
+                self.alive_mask &= ~seat_bit
+                # The folder is normally the player to act, whose slot is already known
+                index = self.current_player_index % len(self.active_players)
+                if self.active_players[index] != player:
+                    index = self.active_players.index(player)
+                del self.active_players[index]
+                # Keep the cached dealer position pointing at the same player
+                if self._dealer_active_index is not None:
+                    if index < self._dealer_active_index:
+                        self._dealer_active_index -= 1
+                    elif index == self._dealer_active_index:
+                        self._dealer_active_index = None
                 # Decrement index so that the next increment in advance_to_next_player
                 # points to the correct next player (who shifted into this slot)
                 self.current_player_index -= 1
-            self.logger.info(f"  {player} folds")
+            if self._log_debug:
+                self.logger.debug("  %s folds", player)
         
         elif action == PlayerAction.CHECK:
-            self.logger.info(f"  {player} checks")
+            if self._log_debug:
+                self.logger.debug("  %s checks", player)
         
         elif action == PlayerAction.CALL:
-            call_amount = min(to_call, self.player_chips[player])
-            self.player_bets[player] += call_amount
-            self.player_chips[player] -= call_amount
+            chips = self.player_chips[player]
+            call_amount = min(to_call, chips)
+            chips -= call_amount
+            self.player_bets[player] = player_bet + call_amount
+            self.player_chips[player] = chips
             self.pot += call_amount
             self.total_pot_contributions[player] += call_amount
-            self.logger.info(f"  {player} calls {call_amount}")
+            if chips == 0:
+                self._all_in_mask |= seat_bit
+            if self._log_debug:
+                self.logger.debug("  %s calls %d", player, call_amount)
         
         elif action == PlayerAction.RAISE:
-            raise_total = amount
-            raise_amount = raise_total - self.player_bets[player]
+            chips = self.player_chips[player]
+            raise_amount = amount - player_bet
 
-            if self.player_chips[player] <= raise_amount:
+            if chips <= raise_amount:
                 # Player does not have enough chips, it's an all-in
-                raise_amount = self.player_chips[player]
+                raise_amount = chips
                 action = PlayerAction.ALL_IN
 
-            self.player_bets[player] += raise_amount
-            self.player_chips[player] -= raise_amount
+            new_bet = player_bet + raise_amount
+            chips -= raise_amount
+            self.player_bets[player] = new_bet
+            self.player_chips[player] = chips
             self.pot += raise_amount
             self.total_pot_contributions[player] += raise_amount
+            if chips == 0:
+                self._all_in_mask |= seat_bit
             
-            actual_raise = self.player_bets[player] - self.current_bet
+            actual_raise = new_bet - self.current_bet
             if actual_raise >= self.min_raise:
                 self.min_raise = actual_raise
             
             if action == PlayerAction.ALL_IN:
-                self.logger.info(f"  {player} goes all-in with {raise_amount}")
-                if self.player_bets[player] > self.current_bet:
-                    self.current_bet = self.player_bets[player]
-                    self.players_acted.clear()
+                if self._log_debug:
+                    self.logger.debug("  %s goes all-in with %d", player, raise_amount)
+                if new_bet > self.current_bet:
+                    self.current_bet = new_bet
+                    self._acted_mask = 0
             else:
-                self.current_bet = self.player_bets[player]
-                self.logger.info(f"  {player} raises to {self.current_bet}")
-                self.players_acted.clear() 
-            self.players_acted.add(player)
-
+                self.current_bet = new_bet
+                if self._log_debug:
+                    self.logger.debug("  %s raises to %d", player, self.current_bet)
+                self._acted_mask = 0
+            self._acted_mask |= seat_bit
 
         elif action == PlayerAction.ALL_IN:
             all_in_amount = self.player_chips[player]
-            self.player_bets[player] += all_in_amount
+            new_bet = player_bet + all_in_amount
+            self.player_bets[player] = new_bet
             self.player_chips[player] = 0
             self.pot += all_in_amount
             self.total_pot_contributions[player] += all_in_amount
-            new_bet = self.player_bets[player]
+            self._all_in_mask |= seat_bit
             if new_bet > self.current_bet:
                 self.current_bet = new_bet
-                self.players_acted.clear() 
-            self.players_acted.add(player)
-            self.logger.info(f"  {player} goes all-in for {all_in_amount}")
+                self._acted_mask = 0
+            self._acted_mask |= seat_bit
+            if self._log_debug:
+                self.logger.debug("  %s goes all-in for %d", player, all_in_amount)
     
     def advance_to_next_player(self):
         """Move to the next player"""
@@ -397,21 +624,16 @@ class PokerGame:
         if len(self.active_players) <= 1:
             return True
         
-        # All non-all-in players have had a chance to act
-        non_all_in_players = [p for p in self.active_players if self.player_chips[p] > 0]
-        if not self.players_acted.issuperset(non_all_in_players):
-            return False
-
-        # All non-folded, non-all-in players have the same amount bet
-        max_bet = self.current_bet
-        for player in non_all_in_players:
-            if self.player_bets[player] != max_bet:
-                return False
-        
-        return True
+        # All non-folded, non-all-in players have acted since the last bet or raise. That also
+        # means they have matched it: a raise clears _acted_mask, and every other action leaves
+        # the player folded, all-in, or with player_bets equal to current_bet (check needs
+        # nothing to call, call pays the difference). So no per-player bet scan is needed.
+        need = self.alive_mask & ~self._all_in_mask
+        return self._acted_mask & need == need
     
     def advance_to_next_round(self):
         """Advance to the next betting round"""
+        self._round_state = None  # the board changes
         if self.round_name == "preflop":
             self.deal_flop()
             self.round_name = "flop"
@@ -426,77 +648,82 @@ class PokerGame:
     
     def deal_flop(self):
         """Deal the flop (3 community cards)"""
-        self.deck.deal_card()  # Burn card
-        for _ in range(3):
-            self.community_cards.append(self.deck.deal_card())
-        self.logger.info(f"FLOP: [{', '.join(map(str, self.community_cards))}]")
+        self.community_cards.extend(self.deck.deal_many(4)[1:])  # Burn card, then three
+        if self._log_info:
+            self.logger.info("FLOP: %s", self.community_cards)
     
     def deal_turn(self):
         """Deal the turn (4th community card)"""
-        self.deck.deal_card()  # Burn card
-        self.community_cards.append(self.deck.deal_card())
-        self.logger.info(f"TURN: {self.community_cards[-1]}")
+        self.community_cards.append(self.deck.deal_many(2)[1])  # Burn card, then one
+        if self._log_info:
+            self.logger.info(f"TURN: {self.community_cards[-1]}")
     
     def deal_river(self):
         """Deal the river (5th community card)"""
-        self.deck.deal_card()  # Burn card
-        self.community_cards.append(self.deck.deal_card())
-        self.logger.info(f"RIVER: {self.community_cards[-1]}")
+        self.community_cards.append(self.deck.deal_many(2)[1])  # Burn card, then one
+        if self._log_info:
+            self.logger.info(f"RIVER: {self.community_cards[-1]}")
     
     def determine_winners(self) -> List[str]:
         """Determine winners using HandEvaluator"""
         if len(self.active_players) == 1:
             return self.active_players
         
-        player_hands_to_evaluate = []
+        # One pass: evaluate each hand and keep the running best and the players tied on it
+        board_codes = [card.code for card in self.community_cards]
+        player_hands = self.player_hands
+        hand_strengths = self.hand_strengths
+        best_strength = 0
+        winners = []
         for player_id in self.active_players:
-            hole_cards = self.player_hands[player_id].cards
-            all_cards = hole_cards + self.community_cards
-            player_hands_to_evaluate.append((player_id, all_cards))
-            
-            best_hand_type, _, best_5_cards = HandEvaluator.evaluate_best_hand(all_cards)
-            self.logger.info(f"  {player_id}: Hand: {hole_cards} -> {best_hand_type} [{', '.join(map(str, best_5_cards))}]")
-
-        winners = HandEvaluator.get_winners(player_hands_to_evaluate)
-        self.logger.info(f"WINNERS: {', '.join(winners)}")
+            strength = HandEvaluator.codes_strength([*player_hands[player_id].codes, *board_codes])
+            hand_strengths[player_id] = strength
+            if strength > best_strength:
+                best_strength = strength
+                winners = [player_id]
+            elif strength == best_strength:
+                winners.append(player_id)
+        
+        if self._log_info:
+            for player_id in self.active_players:
+                hole_cards = self.player_hands[player_id].cards
+                best_hand_type, _, best_5_cards = HandEvaluator.describe_strength(
+                    hole_cards + self.community_cards, hand_strengths[player_id])
+                self.logger.info(f"  {player_id}: Hand: {hole_cards} -> {best_hand_type} [{', '.join(map(str, best_5_cards))}]")
+            self.logger.info("WINNERS: %s", ', '.join(winners))
         return winners
     
     def _distribute_pot(self, winners: List[str]):
         """Distribute the pot among the winners, handling side pots."""
         
-        # Contributions for this hand for all players who put money in
-        contributions = self.total_pot_contributions.copy()
-        active_contributors = [p for p, amount in contributions.items() if amount > 0]
+        # Players who put money in this hand, in seat order
+        contributions = self.total_pot_contributions
+        remaining = [p for p, amount in contributions.items() if amount > 0]
         
-        if not active_contributors:
+        if not remaining:
             return
 
-        # We distribute until pot is empty or contributions are exhausted
-        while self.pot > 0 and sum(contributions.values()) > 0:
-            # Find the smallest non-zero contribution among all contributors
-            # (This defines the size of the current "main" or "side" pot level)
-            min_contribution = min([c for c in contributions.values() if c > 0])
-            
-            current_pot_size = 0
-            eligible_players = []
-            
-            # Collect chips for this pot level from everyone
-            for player in list(contributions.keys()):
-                if contributions[player] > 0:
-                    amount_to_take = min(contributions[player], min_contribution)
-                    current_pot_size += amount_to_take
-                    contributions[player] -= amount_to_take
-                    
-                    # Players who are still active (haven't folded) and contributed 
-                    # to this level are eligible to win this pot
-                    if player in self.active_players:
-                        eligible_players.append(player)
+        # Each distinct contribution level caps one pot layer (main pot first, then side pots).
+        # A layer takes (level - previous level) from every player who reached it, and only
+        # the players who haven't folded among them can win it.
+        previous_level = 0
+        previous_eligible: List[str] = []
+        for level in sorted({contributions[p] for p in remaining}):
+            if self.pot <= 0:
+                break
+            layer_players = remaining
+            current_pot_size = (level - previous_level) * len(layer_players)
+            eligible_players = [p for p in layer_players if self._is_active(p)]
+            previous_level = level
+            remaining = [p for p in layer_players if contributions[p] > level]
 
             if not eligible_players:
-                # Should not happen if logic is correct, but handle gracefully
-                # e.g. everyone folded? But determining winners happens after showdown.
-                # If everyone folded, active_players has 1, who is eligible.
-                continue
+                # Everyone who reached this level has folded: their chips are dead money
+                # for the players contesting the pot below
+                eligible_players = previous_eligible
+                if not eligible_players:
+                    continue
+            previous_eligible = eligible_players
 
             # Determine winner(s) for this specific pot from eligible players
             # We need to re-evaluate winners among ONLY the eligible players
@@ -504,14 +731,26 @@ class PokerGame:
             if len(eligible_players) == 1:
                 pot_winners = eligible_players
             else:
-                # Evaluate hands only for eligible players
-                player_hands_to_evaluate = []
-                for player_id in eligible_players:
-                    hole_cards = self.player_hands[player_id].cards
-                    all_cards = hole_cards + self.community_cards
-                    player_hands_to_evaluate.append((player_id, all_cards))
-                
-                pot_winners = HandEvaluator.get_winners(player_hands_to_evaluate)
+                # The showdown winners hold the best hand at the table, so any of them
+                # in this layer win it outright (the usual case, e.g. the main pot)
+                pot_winners = [p for p in eligible_players if p in winners]
+            if not pot_winners:
+                # Compare eligible players' showdown strengths (evaluated once per hand),
+                # keeping the running best and the players tied on it in one pass
+                hand_strengths = self.hand_strengths
+                best_strength = 0
+                pot_winners = []
+                for p in eligible_players:
+                    strength = hand_strengths.get(p)
+                    if strength is None:
+                        board_codes = [card.code for card in self.community_cards]
+                        strength = hand_strengths[p] = HandEvaluator.codes_strength(
+                            [*self.player_hands[p].codes, *board_codes])
+                    if strength > best_strength:
+                        best_strength = strength
+                        pot_winners = [p]
+                    elif strength == best_strength:
+                        pot_winners.append(p)
             
             # Distribute this pot level
             winnings_per_player = current_pot_size // len(pot_winners)
@@ -519,7 +758,8 @@ class PokerGame:
             
             for winner in pot_winners:
                 self.player_chips[winner] += winnings_per_player
-                self.logger.info(f"{winner} wins {winnings_per_player} from side/main pot")
+                if self._log_info:
+                    self.logger.info(f"{winner} wins {winnings_per_player} from side/main pot")
             
             # Give remainder to first winner (simplified)
             if remainder > 0:
@@ -529,7 +769,7 @@ class PokerGame:
         
         # If pot still has chips (rounding errors or logic slips), give to main winners
         if self.pot > 0:
-             self.logger.warning(f"Pot logic residual: {self.pot}")
+             self.logger.warning("Pot logic residual: %s", self.pot)
              # Give to original overall winners
              for winner in winners:
                  self.player_chips[winner] += self.pot // len(winners)
@@ -537,9 +777,10 @@ class PokerGame:
 
     def _log_round_summary(self):
         """Logs a summary of the current round."""
-        self.logger.info(f"Community Cards: [{', '.join(map(str, self.community_cards))}]")
-        self.logger.info(f"Pot: {self.pot}")
-        self.logger.info("-" * 20)
+        if self._log_info:
+            self.logger.info("Community Cards: %s", self.community_cards)
+            self.logger.info(f"Pot: {self.pot}")
+            self.logger.info("-" * 20)
 
     def get_legal_actions(self, game_state: GameState, player_name: str) -> List[PlayerAction]:
         """
@@ -556,24 +797,15 @@ class PokerGame:
             player_name != game_state.current_player):
             return []
         
-        player_chips = game_state.player_chips[player_name]
-        player_bet = game_state.player_bets[player_name]
-        to_call = game_state.current_bet - player_bet
-        
-        legal_actions = [PlayerAction.FOLD]
-        
-        if to_call == 0:
-            legal_actions.append(PlayerAction.CHECK)
-        else:
-            if player_chips >= to_call:
-                legal_actions.append(PlayerAction.CALL)
-        
-        # Can raise if we have chips beyond the call amount
-        if player_chips > to_call:
-            legal_actions.append(PlayerAction.RAISE)
-        
-        # Can always go all-in if we have chips
-        if player_chips > 0:
-            legal_actions.append(PlayerAction.ALL_IN)
-        
-        return legal_actions
\ No newline at end of file
+        return self._legal_actions(game_state.player_chips[player_name],
+                                   game_state.current_bet - game_state.player_bets[player_name])
+    
+    @staticmethod
+    def _legal_actions(player_chips: int, to_call: int) -> List[PlayerAction]:
+        """Rules behind get_legal_actions, on plain values so the engine can skip building a GameState"""
+        # Fold is always legal; check with nothing to call, call if we can cover it,
+        # raise with chips beyond the call amount, all-in with any chips at all
+        mask = (1 | (to_call == 0) << 1 | (0 < to_call <= player_chips) << 2 |
+                (player_chips > to_call) << 3 | (player_chips > 0) << 4)
+        # Bots get their own list, so one that edits it can't affect the next player
+        return list(_LEGAL_ACTIONS_BY_MASK[mask])
\ No newline at end of file
@@ -1,7 +1,7 @@
 from typing import List, Dict, Any
 
 from bot_api import PokerBotAPI, PlayerAction, GameInfoAPI
-from engine.cards import Card, Rank
+from engine.cards import Card, Rank, HandEvaluator
 from engine.poker_game import GameState
 
 """Implement a randomness to sometimes play hands that aren't strong to beat 
@@ -9,23 +9,26 @@ conservative bot being dealer, folding too often is bad when a blind so fix that
 
 class SoleoBot(PokerBotAPI):
 
+    # Lowest hand strengths that make a pair / two pair (higher strength is better)
+    PAIR_STRENGTH = HandEvaluator.STRENGTH_FLOORS['pair']
+    TWO_PAIR_STRENGTH = HandEvaluator.STRENGTH_FLOORS['two_pair']
+
+    # Starting hands as unordered rank sets (a pocket pair is a single rank)
+    PREMIUM_HANDS = frozenset(frozenset(hand) for hand in [
+        (Rank.ACE, Rank.ACE), (Rank.KING, Rank.KING), (Rank.QUEEN, Rank.QUEEN),
+        (Rank.JACK, Rank.JACK), (Rank.TEN, Rank.TEN),
+        (Rank.ACE, Rank.KING), (Rank.ACE, Rank.QUEEN), (Rank.ACE, Rank.JACK),
+        (Rank.KING, Rank.QUEEN)
+    ])
+    GOOD_SUITED_CONNECTORS = frozenset(frozenset(hand) for hand in [
+        (Rank.KING, Rank.JACK), (Rank.QUEEN, Rank.JACK), (Rank.JACK, Rank.TEN),
+        (Rank.TEN, Rank.NINE), (Rank.NINE, Rank.EIGHT)
+    ])
        
     def __init__(self, name: str):
         super().__init__(name)
         self.hands_played = 0
         self.hands_won = 0
-        
-        # Define strong starting hands
-        self.premium_hands = [
-            (Rank.ACE, Rank.ACE), (Rank.KING, Rank.KING), (Rank.QUEEN, Rank.QUEEN),
-            (Rank.JACK, Rank.JACK), (Rank.TEN, Rank.TEN),
-            (Rank.ACE, Rank.KING), (Rank.ACE, Rank.QUEEN), (Rank.ACE, Rank.JACK),
-            (Rank.KING, Rank.QUEEN)
-        ]
-        self.good_suited_connectors = [
-            (Rank.KING, Rank.JACK), (Rank.QUEEN, Rank.JACK), (Rank.JACK, Rank.TEN),
-            (Rank.TEN, Rank.NINE), (Rank.NINE, Rank.EIGHT)
-        ]
     
     def get_action(self, game_state: GameState, hole_cards: List[Card], 
                    legal_actions: List[PlayerAction], min_bet: int, max_bet: int) -> tuple:
@@ -43,13 +46,10 @@ class SoleoBot(PokerBotAPI):
             return PlayerAction.FOLD, 0
         
         card1, card2 = hole_cards
-        hand_tuple1 = (card1.rank, card2.rank)
-        hand_tuple2 = (card2.rank, card1.rank)
+        hand = frozenset((card1.rank, card2.rank))
         
-        is_premium = (hand_tuple1 in self.premium_hands or hand_tuple2 in self.premium_hands)
-        is_suited_connector = (card1.suit == card2.suit and 
-                             (hand_tuple1 in self.good_suited_connectors or 
-                              hand_tuple2 in self.good_suited_connectors))
+        is_premium = hand in self.PREMIUM_HANDS
+        is_suited_connector = card1.suit == card2.suit and hand in self.GOOD_SUITED_CONNECTORS
         is_pocket_pair = card1.rank == card2.rank
 
         if not (is_premium or is_suited_connector or is_pocket_pair):
@@ -74,11 +74,10 @@ class SoleoBot(PokerBotAPI):
         """Strategy for post-flop betting (flop, turn, river)"""
         
         all_cards = hole_cards + game_state.community_cards
-        hand_type, _, _ = HandEvaluator.evaluate_best_hand(all_cards)
-        hand_rank = HandEvaluator.HAND_RANKINGS[hand_type]
+        strength = HandEvaluator.cached_strength(all_cards)
 
         # Strong hand (two pair or better)
-        if hand_rank >= HandEvaluator.HAND_RANKINGS['two_pair']:
+        if strength >= self.TWO_PAIR_STRENGTH:
             if PlayerAction.RAISE in legal_actions:
                 # Bet half the pot
                 raise_amount = min(game_state.pot // 2, max_bet)
@@ -89,7 +88,7 @@ class SoleoBot(PokerBotAPI):
             return PlayerAction.CHECK, 0
 
         # Decent hand (pair)
-        if hand_rank >= HandEvaluator.HAND_RANKINGS['pair']:
+        if strength >= self.PAIR_STRENGTH:
             if PlayerAction.CHECK in legal_actions:
                 return PlayerAction.CHECK, 0
             # Call small bets
@@ -98,7 +97,7 @@ class SoleoBot(PokerBotAPI):
                 return PlayerAction.CALL, 0
         
         # Drawing hands
-        if self._has_strong_draw(all_cards):
+        if GameInfoAPI.has_strong_draw(all_cards):
             if PlayerAction.CHECK in legal_actions:
                 return PlayerAction.CHECK, 0
             # Call if pot odds are good
@@ -111,26 +110,6 @@ class SoleoBot(PokerBotAPI):
             return PlayerAction.CHECK, 0
         return PlayerAction.FOLD, 0
 
-    def _has_strong_draw(self, all_cards: List[Card]) -> bool:
-        """Check for strong drawing hands (flush or open-ended straight)"""
-        # Flush draw
-        suits = [card.suit for card in all_cards]
-        for suit in set(suits):
-            if suits.count(suit) == 4:
-                return True
-        
-        # Open-ended straight draw
-        ranks = sorted(list(set(card.rank.value for card in all_cards)))
-        for i in range(len(ranks) - 3):
-            if ranks[i+3] - ranks[i] == 3 and len(ranks) >=4 :
-                 # e.g., 5,6,7,8
-                return True
-            # Ace-low straight draw
-            if set(ranks).issuperset({2,3,4,5}) or set(ranks).issuperset({14,2,3,4}): # A,2,3,4
-                 return True
-
-        return False
-
     def hand_complete(self, game_state: GameState, hand_result: Dict[str, Any]):
         """Track conservative play results"""
         self.hands_played += 1
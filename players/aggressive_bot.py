@@ -17,6 +17,9 @@ class AggressiveBot(PokerBotAPI):
     Good example of an aggressive playing style.
     """
     
+    # Lowest hand strength that makes a pair (strengths order hands, higher is better)
+    PAIR_STRENGTH = HandEvaluator.STRENGTH_FLOORS['pair']
+    
     def __init__(self, name: str):
         super().__init__(name)
         self.hands_played = 0
@@ -43,7 +46,7 @@ class AggressiveBot(PokerBotAPI):
         # High probability of raising
         if PlayerAction.RAISE in legal_actions and random.random() < self.raise_frequency:
             # Raise 3-4x the big blind
-            raise_amount = min(random.randint(3, 4) * game_state.big_blind, max_bet)
+            raise_amount = min(random.choice((3, 4)) * game_state.big_blind, max_bet)
             raise_amount = max(raise_amount, min_bet)
             
             # Ensure raise amount is actually greater than current_bet if raising
@@ -66,11 +69,10 @@ class AggressiveBot(PokerBotAPI):
                            legal_actions: List[PlayerAction], min_bet: int, max_bet: int) -> tuple:
         """Aggressive post-flop strategy"""
         all_cards = hole_cards + game_state.community_cards
-        hand_type, _, _ = HandEvaluator.evaluate_best_hand(all_cards)
-        hand_rank = HandEvaluator.HAND_RANKINGS[hand_type]
+        strength = HandEvaluator.cached_strength(all_cards)
 
         # Strong hand (top pair or better)
-        if hand_rank >= HandEvaluator.HAND_RANKINGS['pair']:
+        if strength >= self.PAIR_STRENGTH:
             if PlayerAction.RAISE in legal_actions:
                 # Bet 2/3 to full pot
                 raise_amount = min(game_state.pot, max_bet)
@@ -89,7 +91,7 @@ class AggressiveBot(PokerBotAPI):
                 return PlayerAction.CHECK, 0
         
         # Strong draw - play aggressively (semi-bluff)
-        if self._has_strong_draw(all_cards):
+        if GameInfoAPI.has_strong_draw(all_cards):
             if PlayerAction.RAISE in legal_actions:
                  # Bet half pot on a draw
                 raise_amount = min(game_state.pot // 2, max_bet)
@@ -123,23 +125,6 @@ class AggressiveBot(PokerBotAPI):
         
         return PlayerAction.FOLD, 0
 
-    def _has_strong_draw(self, all_cards: List[Card]) -> bool:
-        """Check for strong drawing hands (flush or open-ended straight)"""
-        # Flush draw
-        suits = [card.suit for card in all_cards]
-        for suit in set(suits):
-            if suits.count(suit) == 4:
-                return True
-        
-        # Open-ended straight draw
-        ranks = sorted(list(set(card.rank.value for card in all_cards)))
-        for i in range(len(ranks) - 3):
-            if ranks[i+3] - ranks[i] == 3 and len(ranks) >=4 :
-                return True
-            if set(ranks).issuperset({2,3,4,5}) or set(ranks).issuperset({14,2,3,4}):
-                 return True
-        return False
-    
     def hand_complete(self, game_state: GameState, hand_result: Dict[str, Any]):
         self.hands_played += 1
         if 'winners' in hand_result and self.name in hand_result['winners']:
@@ -16,18 +16,21 @@ class ConservativeBot(PokerBotAPI):
     Good example of a tight playing style.
     """
     
+    game_state_fields = frozenset({"pot", "current_bet"})
+    
+    # Strong starting hands keyed by the two cards' rank bits OR'd together, so the key
+    # is order-free and a pocket pair sets a single bit
+    PREMIUM_HANDS = frozenset((1 << high) | (1 << low) for high, low in [
+        (Rank.ACE, Rank.ACE), (Rank.KING, Rank.KING), (Rank.QUEEN, Rank.QUEEN),
+        (Rank.JACK, Rank.JACK), (Rank.TEN, Rank.TEN), (Rank.NINE, Rank.NINE),
+        (Rank.ACE, Rank.KING), (Rank.ACE, Rank.QUEEN), (Rank.ACE, Rank.JACK),
+        (Rank.KING, Rank.QUEEN), (Rank.KING, Rank.JACK), (Rank.QUEEN, Rank.JACK)
+    ])
+    
     def __init__(self, name: str):
         super().__init__(name)
         self.hands_played = 0
         self.hands_won = 0
-        
-        # Define strong starting hands
-        self.premium_hands = [
-            (Rank.ACE, Rank.ACE), (Rank.KING, Rank.KING), (Rank.QUEEN, Rank.QUEEN),
-            (Rank.JACK, Rank.JACK), (Rank.TEN, Rank.TEN), (Rank.NINE, Rank.NINE),
-            (Rank.ACE, Rank.KING), (Rank.ACE, Rank.QUEEN), (Rank.ACE, Rank.JACK),
-            (Rank.KING, Rank.QUEEN), (Rank.KING, Rank.JACK), (Rank.QUEEN, Rank.JACK)
-        ]
     
     def get_action(self, game_state: GameState, hole_cards: List[Card], 
                    legal_actions: List[PlayerAction], min_bet: int, max_bet: int) -> tuple:
@@ -38,24 +41,9 @@ class ConservativeBot(PokerBotAPI):
         
         card1, card2 = hole_cards
         
-        # Check if we have a premium hand
-        hand_tuple1 = (card1.rank, card2.rank)
-        hand_tuple2 = (card2.rank, card1.rank)  # Check both orders
-        
-        is_premium = (hand_tuple1 in self.premium_hands or 
-                     hand_tuple2 in self.premium_hands)
-        
-        # Also consider suited premium hands
-        is_suited_premium = (card1.suit == card2.suit and 
-                           (hand_tuple1 in self.premium_hands or 
-                            hand_tuple2 in self.premium_hands))
-        
-        # Check for high pocket pairs
-        is_high_pocket_pair = (card1.rank == card2.rank and 
-                              card1.rank.value >= 9)  # 9s or better
-        
-        # Only play premium hands or high pocket pairs
-        if not (is_premium or is_suited_premium or is_high_pocket_pair):
+        # Only play premium hands (in either order). The high pocket pairs (9s or better)
+        # are all in the table, and suitedness doesn't change the decision.
+        if (card1.rank_bit | card2.rank_bit) not in self.PREMIUM_HANDS:
             return PlayerAction.FOLD, 0
         
         # We have a good hand - decide what to do
@@ -17,6 +17,8 @@ class RandomBot(PokerBotAPI):
     Useful for testing the tournament system.
     """
     
+    game_state_fields = frozenset({"pot"})
+    
     def __init__(self, name: str):
         super().__init__(name)
         self.hands_played = 0
@@ -35,7 +37,8 @@ class RandomBot(PokerBotAPI):
             if max_raise < min_bet:
                 max_raise = min_bet
                 
-            amount = random.randint(min_bet, int(max_raise))
+            # Same draw as randint(min_bet, max_raise), without randint's extra call layers
+            amount = min_bet + random.randrange(int(max_raise) - min_bet + 1)
             return action, amount
         
         # All other actions don't need an amount
@@ -3,38 +3,118 @@
 Script to run multiple tournaments and aggregate results
 """
 import collections
+import multiprocessing
+import os
 import time
 import sys
 import logging
+from functools import lru_cache
 from tournament_runner import TournamentRunner, TournamentSettings, TournamentType
 
-def run_many(num_tournaments=1000):
+# Default settings (matching run_tournament.py)
+SETTINGS = TournamentSettings(
+    tournament_type=TournamentType.FREEZE_OUT,
+    starting_chips=1000,
+    small_blind=10,
+    big_blind=20,
+    time_limit_per_action=10.0,
+    blind_increase_interval=10,
+    blind_increase_factor=1.5
+)
+
+def _silence_logging():
+    # We configure basicConfig with a NullHandler so TournamentRunner's basicConfig call does nothing.
+    logging.basicConfig(handlers=[logging.NullHandler()], level=logging.CRITICAL)
+    # Also force set level for existing loggers just in case
+    logging.getLogger().setLevel(logging.CRITICAL)
+
+@lru_cache(maxsize=None)
+def calculate_payouts(num_players, entry_fee=1000):
+    pool = num_players * entry_fee
+    payouts = {} # position -> amount
+    
+    # Top-Heavy Payout Structures (Favoring 1st/2nd, Max Top 8)
+    if num_players <= 5:
+        # Winner takes all
+        percentages = [1.00]
+    elif num_players <= 6:
+        # Top 2 (70/30)
+        percentages = [0.70, 0.30]
+    elif num_players <= 10:
+        # Top 3 (55/30/15)
+        percentages = [0.55, 0.30, 0.15]
+    elif num_players <= 15:
+        # Top 4 (50/25/15/10)
+        percentages = [0.50, 0.25, 0.15, 0.10]
+    elif num_players <= 25:
+        # Top 5 (45/25/15/10/5)
+        percentages = [0.45, 0.25, 0.15, 0.10, 0.05]
+    elif num_players <= 30:
+        # Top 6 (42/24/14/10/6/4)
+        percentages = [0.42, 0.24, 0.14, 0.10, 0.06, 0.04]
+    elif num_players <= 49:
+        # Top 7 (40/22/14/10/7/4/3)
+        percentages = [0.40, 0.22, 0.14, 0.10, 0.07, 0.04, 0.03]
+    else:
+        # Top 8 (50+) (38/20/14/10/7/5/4/2)
+        percentages = [0.38, 0.20, 0.14, 0.10, 0.07, 0.05, 0.04, 0.02]
+        
+    for i, pct in enumerate(percentages):
+        payouts[i + 1] = int(pool * pct)
+        
+    return payouts
+
+@lru_cache(maxsize=None)
+def _standing_deltas(num_players, entry_fee=1000):
+    """
+    Per finishing position (index 1..num_players): the (earnings, points, podium points)
+    a player adds to the aggregate. There are only a few distinct table sizes, so each
+    is worked out once.
+    """
+    payout_structure = calculate_payouts(num_players, entry_fee)
+    deltas = [None]
+    for position in range(1, num_players + 1):
+        # Entry fee, plus prize money if any
+        earnings = payout_structure.get(position, 0) - entry_fee
+        # Standard Points
+        points = num_players - position
+        # Podium Points
+        podium = max(0, 4 - position)
+        deltas.append((earnings, points, podium))
+    return tuple(deltas)
+
+# One runner per process, reused for every tournament it runs
+_runner = None
+
+def _run_one(_index):
+    """Run one tournament and return just what run_many aggregates: (standings, hands, disqualified bots)"""
+    global _runner
+    if _runner is None:
+        _runner = TournamentRunner(SETTINGS, "players", "logs")
+    # Only the aggregate is reported, and per-tournament result files named by the second
+    # would collide between workers, so none are written
+    results = _runner.run_tournament(save_results=False)
+    disqualified = [bot_name for bot_name, stats in results['bot_stats'].items() if stats['is_disqualified']]
+    return results['final_standings'], results['total_hands'], disqualified
+
+def run_many(num_tournaments=1000, workers=None):
+    """
+    Run num_tournaments independent tournaments and print aggregate results.
+    Tournaments are spread over `workers` processes (default: one per CPU);
+    workers=1 runs them all in this process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, num_tournaments))
     print(f"Running {num_tournaments} tournaments...")
     print("=" * 40)
     
     # Disable logging ONLY if running multiple tournaments to avoid spam
     if num_tournaments > 1:
-        # We configure basicConfig with a NullHandler so TournamentRunner's basicConfig call does nothing.
-        logging.basicConfig(handlers=[logging.NullHandler()], level=logging.CRITICAL)
-        # Also force set level for existing loggers just in case
-        logging.getLogger().setLevel(logging.CRITICAL)
+        _silence_logging()
     
-    # Default settings (matching run_tournament.py)
-    settings = TournamentSettings(
-        tournament_type=TournamentType.FREEZE_OUT,
-        starting_chips=1000,
-        small_blind=10,
-        big_blind=20,
-        time_limit_per_action=10.0,
-        blind_increase_interval=10,
-        blind_increase_factor=1.5
-    )
-    
-    win_counts = collections.Counter()
-    disqualified_counts = collections.Counter()
-    total_points = collections.Counter()
-    podium_points = collections.Counter()
-    total_earnings = collections.Counter()
+    # Per-bot running totals, one row per bot: [earnings, points, podium points, wins, DQs]
+    totals = collections.defaultdict(lambda: [0, 0, 0, 0, 0])
     total_hands_played = 0
     start_time = time.time()
     
@@ -42,138 +122,87 @@ def run_many(num_tournaments=1000):
     if hasattr(sys.stdout, 'reconfigure'):
         sys.stdout.reconfigure(encoding='utf-8')
 
-    def calculate_payouts(num_players, entry_fee=1000):
-        pool = num_players * entry_fee
-        payouts = {} # position -> amount
-        
-        # Top-Heavy Payout Structures (Favoring 1st/2nd, Max Top 8)
-        if num_players <= 5:
-            # Winner takes all
-            percentages = [1.00]
-        elif num_players <= 6:
-            # Top 2 (70/30)
-            percentages = [0.70, 0.30]
-        elif num_players <= 10:
-            # Top 3 (55/30/15)
-            percentages = [0.55, 0.30, 0.15]
-        elif num_players <= 15:
-            # Top 4 (50/25/15/10)
-            percentages = [0.50, 0.25, 0.15, 0.10]
-        elif num_players <= 25:
-            # Top 5 (45/25/15/10/5)
-            percentages = [0.45, 0.25, 0.15, 0.10, 0.05]
-        elif num_players <= 30:
-            # Top 6 (42/24/14/10/6/4)
-            percentages = [0.42, 0.24, 0.14, 0.10, 0.06, 0.04]
-        elif num_players <= 49:
-            # Top 7 (40/22/14/10/7/4/3)
-            percentages = [0.40, 0.22, 0.14, 0.10, 0.07, 0.04, 0.03]
-        else:
-            # Top 8 (50+) (38/20/14/10/7/5/4/2)
-            percentages = [0.38, 0.20, 0.14, 0.10, 0.07, 0.05, 0.04, 0.02]
-            
-        for i, pct in enumerate(percentages):
-            payouts[i + 1] = int(pool * pct)
-            
-        return payouts
-
+    pool = None
     try:
-        for i in range(num_tournaments):
-            # Show progress every 10 runs
-            if (i + 1) % 10 == 0:
-                print(f"Running tournament {i + 1}/{num_tournaments}...", end='\r')
-                
-            # Create a new runner for each tournament to ensure clean state
-            runner = TournamentRunner(settings, "players", "logs")
-            
-            results = runner.run_tournament()
+        if workers > 1:
+            # Tournaments are independent, so they run in parallel and are merged here as they finish
+            pool = multiprocessing.get_context("spawn").Pool(workers, initializer=_silence_logging)
+            chunksize = max(1, num_tournaments // (workers * 8))
+            all_results = pool.imap_unordered(_run_one, range(num_tournaments), chunksize)
+        else:
+            all_results = map(_run_one, range(num_tournaments))
+        
+        # A \r progress line only makes sense on a terminal, not in redirected output
+        show_progress = sys.stdout.isatty()
+        
+        for i, (standings, hands, disqualified) in enumerate(all_results):
+            # Show progress every 100 runs
+            if show_progress and (i + 1) % 100 == 0:
+                print(f"Finished tournament {i + 1}/{num_tournaments}...", end='\r')
             
             # Track winner
-            if results['final_standings']:
-                winner_name = results['final_standings'][0][0]
-                win_counts[winner_name] += 1
-                
-                standings = results['final_standings']
-                num_players = len(standings)
+            if standings:
+                totals[standings[0][0]][3] += 1
                 
-                # Calculate payouts for this tournament
-                payout_structure = calculate_payouts(num_players)
+                # Earnings, points and podium points for each finishing position
+                deltas = _standing_deltas(len(standings))
                 
                 for player_name, chips, position in standings:
-                    # Deduct entry fee
-                    total_earnings[player_name] -= 1000
-                    
-                    # Add prize money if any
-                    if position in payout_structure:
-                        total_earnings[player_name] += payout_structure[position]
-                    
-                    # Standard Points
-                    points = num_players - position
-                    total_points[player_name] += points
-                    
-                    # Podium Points
-                    if position == 1:
-                        podium_points[player_name] += 3
-                    elif position == 2:
-                        podium_points[player_name] += 2
-                    elif position == 3:
-                        podium_points[player_name] += 1
+                    earnings, points, podium = deltas[position]
+                    row = totals[player_name]
+                    row[0] += earnings
+                    row[1] += points
+                    row[2] += podium
             
             # Track disqualifications
-            for bot_name, stats in results['bot_stats'].items():
-                if stats['is_disqualified']:
-                    disqualified_counts[bot_name] += 1
+            for bot_name in disqualified:
+                totals[bot_name][4] += 1
             
-            total_hands_played += results['total_hands']
+            total_hands_played += hands
             
     except KeyboardInterrupt:
         print("\nStopping early...")
     except Exception as e:
         print(f"\nError during execution: {e}")
+    finally:
+        if pool is not None:
+            pool.terminate()
         
     try:
         end_time = time.time()
         duration = end_time - start_time
         
-        num_runs = sum(win_counts.values())
+        num_runs = sum(row[3] for row in totals.values())
         
         if num_runs == 0:
             print("No tournaments completed.")
             return
 
-        print("\n" + "="*115)
-        print(f"AGGREGATE RESULTS ({num_runs} tournaments run)")
-        print("="*115)
-        print(f"Total Duration: {duration:.2f}s ({duration/num_runs:.2f}s per run)")
+        # The report is built up and written in one go
+        lines = ["\n" + "="*115]
+        lines.append(f"AGGREGATE RESULTS ({num_runs} tournaments run)")
+        lines.append("="*115)
+        lines.append(f"Total Duration: {duration:.2f}s ({duration/num_runs:.2f}s per run)")
         if num_runs > 0:
-            print(f"Avg Hands per Tournament: {total_hands_played / num_runs:.1f}")
-        print("-" * 115)
-        print(f"{ 'Bot Name':<30} | {'Earnings':<12} | {'Points':<8} | {'Avg Pts':<8} | {'Podium':<8} | {'Wins':<8} | {'Win %':<8} | {'DQ':<5}")
-        print("-" * 115)
+            lines.append(f"Avg Hands per Tournament: {total_hands_played / num_runs:.1f}")
+        lines.append("-" * 115)
+        lines.append(f"{ 'Bot Name':<30} | {'Earnings':<12} | {'Points':<8} | {'Avg Pts':<8} | {'Podium':<8} | {'Wins':<8} | {'Win %':<8} | {'DQ':<5}")
+        lines.append("-" * 115)
         
-        # Sort by Earnings
-        sorted_bots = total_earnings.most_common()
+        # Sort by Earnings (every bot that finished or was disqualified has a row)
+        total_earnings = {bot_name: row[0] for bot_name, row in totals.items()}
+        sorted_bots = sorted(total_earnings, key=total_earnings.__getitem__, reverse=True)
         
-        # Include bots that have 0 points (if any, e.g. always last place or DQ'd before play)
-        all_bots = set(disqualified_counts.keys()) | set(total_points.keys())
-        for bot in all_bots:
-            if bot not in total_earnings:
-                sorted_bots.append((bot, 0))
-                
-        # Re-sort to be sure if we appended
-        sorted_bots.sort(key=lambda x: x[1], reverse=True)
-        
-        for bot_name, earnings in sorted_bots:
-            wins = win_counts[bot_name]
+        for bot_name in sorted_bots:
+            earnings, points, p_points, wins, dqs = totals[bot_name]
             win_rate = (wins / num_runs) * 100 if num_runs > 0 else 0
-            points = total_points[bot_name]
             avg_points = points / num_runs if num_runs > 0 else 0
-            p_points = podium_points[bot_name]
-            dqs = disqualified_counts[bot_name]
             
             earnings_str = f"{earnings:,}"
             
-            print(f"{bot_name:<30} | {earnings_str:<12} | {points:<8} | {avg_points:<8.2f} | {p_points:<8} | {wins:<8} | {win_rate:>7.1f}% | {dqs:<5}")
+            lines.append(f"{bot_name:<30} | {earnings_str:<12} | {points:<8} | {avg_points:<8.2f} | {p_points:<8} | {wins:<8} | {win_rate:>7.1f}% | {dqs:<5}")
+        
+        print("\n".join(lines))
     except KeyboardInterrupt:
         print("\nOutput interrupted.")
 
@@ -181,10 +210,12 @@ if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description='Run multiple poker tournaments.')
     parser.add_argument('-n', '--count', type=int, default=1000, help='Number of tournaments to run')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='Worker processes to spread tournaments over (default: one per CPU, 1 = no parallelism)')
     args = parser.parse_args()
     
     try:
-        run_many(args.count)
+        run_many(args.count, args.workers)
     except KeyboardInterrupt:
         print("\nScript interrupted by user.")
         sys.exit(0)
@@ -0,0 +1,85 @@
+"""
+Tests for bot loading and bot file validation
+Run from the repository root: python -m unittest discover -s tests
+"""
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+
+from bot_manager import BotManager, validate_bot_file
+
+
+HEADER = """
+from bot_api import PokerBotAPI, PlayerAction
+"""
+
+GET_ACTION = """
+    def get_action(self, game_state, hole_cards, legal_actions, min_bet, max_bet):
+        return PlayerAction.FOLD, 0
+"""
+
+HAND_COMPLETE = """
+    def hand_complete(self, game_state, hand_result):
+        pass
+"""
+
+
+class ValidateBotFileTest(unittest.TestCase):
+    
+    def validate(self, source: str):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test_bot.py")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(textwrap.dedent(source))
+            return validate_bot_file(path)
+    
+    def test_complete_bot_is_valid(self):
+        ok, message = self.validate(HEADER + "class MyBot(PokerBotAPI):" + GET_ACTION + HAND_COMPLETE)
+        self.assertTrue(ok, message)
+    
+    def test_missing_get_action_is_rejected(self):
+        ok, message = self.validate(HEADER + "class MyBot(PokerBotAPI):" + HAND_COMPLETE)
+        self.assertFalse(ok)
+        self.assertEqual(message, "Missing required method: get_action")
+    
+    def test_methods_inherited_from_same_file_base_count(self):
+        source = (HEADER + "class BaseBot(PokerBotAPI):" + GET_ACTION
+                  + "\nclass MyBot(BaseBot):" + HAND_COMPLETE)
+        ok, message = self.validate(source)
+        self.assertTrue(ok, message)
+    
+    def test_missing_get_action_is_rejected_when_validated_by_import(self):
+        # An aliased base class can't be resolved from the source, so the file is imported
+        source = "import bot_api\nApi = bot_api.PokerBotAPI\n" + "class MyBot(Api):" + HAND_COMPLETE
+        ok, message = self.validate(source)
+        self.assertFalse(ok)
+        self.assertEqual(message, "Missing required method: get_action")
+
+
+
+class BotReloadTest(unittest.TestCase):
+    
+    def test_module_globals_are_fresh_after_cleanup(self):
+        # A bot that counts its instances in a module global
+        source = (HEADER + "INSTANCES = 0\n\nclass CountingBot(PokerBotAPI):\n"
+                  "    def __init__(self, name):\n"
+                  "        super().__init__(name)\n"
+                  "        global INSTANCES\n"
+                  "        INSTANCES += 1\n"
+                  + GET_ACTION + HAND_COMPLETE)
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "counting_bot.py"), "w", encoding="utf-8") as f:
+                f.write(textwrap.dedent(source))
+            
+            manager = BotManager(directory)
+            for _ in range(2):  # two tournaments in a row
+                self.assertEqual(manager.load_all_bots(), ["counting_bot"])
+                self.assertEqual(sys.modules["counting_bot"].INSTANCES, 1)
+                manager.cleanup()
+                self.assertNotIn("counting_bot", sys.modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Tests for the hand evaluator
+Run from the repository root: python -m unittest discover -s tests
+"""
+import random
+import unittest
+from itertools import combinations
+
+from engine.cards import Card, Deck, Rank, Suit, HandEvaluator
+
+
+RANKS = {'2': Rank.TWO, '3': Rank.THREE, '4': Rank.FOUR, '5': Rank.FIVE, '6': Rank.SIX,
+         '7': Rank.SEVEN, '8': Rank.EIGHT, '9': Rank.NINE, 'T': Rank.TEN, 'J': Rank.JACK,
+         'Q': Rank.QUEEN, 'K': Rank.KING, 'A': Rank.ACE}
+SUITS = {'h': Suit.HEARTS, 'd': Suit.DIAMONDS, 'c': Suit.CLUBS, 's': Suit.SPADES}
+
+
+def cards(text: str):
+    """Cards from short notation, e.g. cards("Ah Td 2c")"""
+    return [Card(RANKS[card[0]], SUITS[card[1]]) for card in text.split()]
+
+
+def strength(text: str) -> int:
+    return HandEvaluator.hand_strength(cards(text))
+
+
+class HandClassTest(unittest.TestCase):
+
+    def assert_hand(self, text, hand_type, tiebreakers):
+        self.assertEqual(HandEvaluator.evaluate_hand(cards(text)), (hand_type, tiebreakers))
+
+    def test_every_hand_class(self):
+        self.assert_hand("Th Jh Qh Kh Ah", 'royal_flush', [14, 13, 12, 11, 10])
+        self.assert_hand("5h 6h 7h 8h 9h", 'straight_flush', [9, 8, 7, 6, 5])
+        self.assert_hand("9c 9d 9h 9s 2c", 'four_of_a_kind', [9, 2])
+        self.assert_hand("Kc Kd Kh As Ad", 'full_house', [13, 14])
+        self.assert_hand("2s 7s 9s Js Ks", 'flush', [13, 11, 9, 7, 2])
+        self.assert_hand("6h 7d 8c 9s Th", 'straight', [10, 9, 8, 7, 6])
+        self.assert_hand("Qc Qd Qh 4s 2c", 'three_of_a_kind', [12, 4, 2])
+        self.assert_hand("Ac Ad Kc Kd 2h", 'two_pair', [14, 13, 2])
+        self.assert_hand("8c 8d Ah 5s 3c", 'pair', [8, 14, 5, 3])
+        self.assert_hand("Ac Kd 7h 5s 2c", 'high_card', [14, 13, 7, 5, 2])
+
+    def test_wheel_is_the_lowest_straight(self):
+        self.assert_hand("Ah 2d 3c 4s 5h", 'straight', [5, 4, 3, 2, 1])
+        self.assertLess(strength("Ah 2d 3c 4s 5h"), strength("2h 3d 4c 5s 6h"))
+        self.assertGreater(strength("Ah 2d 3c 4s 5h"), strength("Ac Ad Ah Ks Qd"))
+        # Ace-high straight beats it
+        self.assertLess(strength("Ah 2d 3c 4s 5h"), strength("Th Jd Qc Ks Ah"))
+
+    def test_steel_wheel_is_the_lowest_straight_flush(self):
+        steel_wheel = strength("Ah 2h 3h 4h 5h")
+        self.assertEqual(HandEvaluator.evaluate_hand(cards("Ah 2h 3h 4h 5h"))[0], 'straight_flush')
+        self.assertLess(steel_wheel, strength("2h 3h 4h 5h 6h"))
+        self.assertGreater(steel_wheel, strength("Ac Ad Ah As Kd"))
+        # The best hand from seven cards finds it over the pair of kings
+        self.assertEqual(HandEvaluator.hand_strength(cards("Ah 2h 3h 4h 5h Kc Kd")), steel_wheel)
+
+    def test_quads_beat_full_house(self):
+        self.assertGreater(strength("2c 2d 2h 2s 3c"), strength("Ac Ad Ah Ks Kd"))
+        board = "9c 9d Kh 4s 2c"
+        winners = HandEvaluator.get_winners([("quads", cards("9h 9s " + board)),
+                                             ("full_house", cards("Kc Kd " + board))])
+        self.assertEqual(winners, ["quads"])
+
+    def test_kicker_decides(self):
+        board = "Ah 7s 5d 3c 2h"
+        winners = HandEvaluator.get_winners([("ace_king", cards("Ac Kd " + board)),
+                                             ("ace_queen", cards("As Qd " + board))])
+        self.assertEqual(winners, ["ace_king"])
+        self.assertGreater(strength("Ac Ad Kc Kd 3h"), strength("As Ah Ks Kh 2d"))
+
+    def test_board_plays_is_a_tie(self):
+        # Neither player's hole cards beat the board's five
+        board = "Ah Ks Qd Jc 9h"
+        winners = HandEvaluator.get_winners([("first", cards("4c 6d " + board)),
+                                             ("second", cards("3c 2d " + board))])
+        self.assertEqual(winners, ["first", "second"])
+        # Same two pair and kicker in different suits
+        self.assertEqual(strength("Ac Ad Kc Kd 2h"), strength("As Ah Ks Kh 2d"))
+
+    def test_strength_floors_match_hand_types(self):
+        for text in ["Th Jh Qh Kh Ah", "9c 9d 9h 9s 2c", "Kc Kd Kh As Ad", "8c 8d Ah 5s 3c",
+                     "Ac Kd 7h 5s 2c", "Ah 2d 3c 4s 5h", "Ac Ad Kc Kd 2h"]:
+            hand_type = HandEvaluator.evaluate_hand(cards(text))[0]
+            value = strength(text)
+            self.assertGreaterEqual(value, HandEvaluator.STRENGTH_FLOORS[hand_type])
+            better = [floor for name, floor in HandEvaluator.STRENGTH_FLOORS.items()
+                      if HandEvaluator.HAND_RANKINGS[name] > HandEvaluator.HAND_RANKINGS[hand_type]]
+            self.assertTrue(all(value < floor for floor in better), text)
+
+
+class BestHandTest(unittest.TestCase):
+
+    def test_seven_cards_score_as_their_best_five(self):
+        rng = random.Random(1)
+        deck = Deck().cards
+        for _ in range(300):
+            hand = rng.sample(deck, 7)
+            best = max(HandEvaluator.hand_strength(list(five)) for five in combinations(hand, 5))
+            self.assertEqual(HandEvaluator.hand_strength(hand), best)
+            self.assertEqual(HandEvaluator.cached_strength(hand), best)
+            hand_type, tiebreakers, best_five = HandEvaluator.evaluate_best_hand(hand)
+            self.assertEqual(HandEvaluator.hand_strength(best_five), best)
+            self.assertEqual(HandEvaluator.evaluate_hand(best_five), (hand_type, tiebreakers))
+
+    def test_evaluate_best_hand_batch(self):
+        hole = cards("Ah Kh")
+        boards = [cards("Qh Jh Th 2c 3d"), cards("Ac Ad 7s 7c 2h"), cards("2c 3d 4s 5c 9h")]
+        self.assertEqual(HandEvaluator.evaluate_best_hand_batch(hole, boards),
+                         [HandEvaluator.hand_strength(hole + board) for board in boards])
+        self.assertEqual(HandEvaluator.evaluate_best_hand_batch(hole, []), [])
+
+    def test_evaluate_many(self):
+        board = cards("Ah 7s 5d 3c 2h")
+        holes = [cards("Ac Kd"), cards("As Qd"), cards("4c 6d"), cards("7c 7d")]
+        strengths = HandEvaluator.evaluate_many(holes, board)
+        self.assertEqual(strengths, [HandEvaluator.hand_strength(hole + board) for hole in holes])
+        # Set of sevens < wheel < seven-high straight
+        self.assertLess(strengths[3], HandEvaluator.hand_strength(cards("4s 9d") + board))
+        self.assertLess(HandEvaluator.hand_strength(cards("4s 9d") + board), strengths[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
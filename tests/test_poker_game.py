@@ -0,0 +1,195 @@
+"""
+Tests for hand play in the game engine
+Run from the repository root: python -m unittest discover -s tests
+"""
+import unittest
+
+from engine.cards import Deck
+from engine.poker_game import PokerGame, PlayerAction
+
+from test_cards import cards
+
+
+class StackedDeck(Deck):
+    """Deck that deals the given cards first, in order, whenever it is shuffled"""
+
+    def __init__(self, deal_order):
+        self.deal_order = deal_order
+        super().__init__()
+
+    def shuffle(self):
+        codes = {card.code for card in self.deal_order}
+        rest = [card for card in self.cards if card.code not in codes]
+        # deal_many takes from the end of the list
+        self.cards[:] = rest + self.deal_order[::-1]
+
+
+class ScriptedBot:
+    """Plays the given (action, amount) pairs in turn, then checks or calls"""
+
+    def __init__(self, name, log, *actions):
+        self.name = name
+        self.log = log
+        self.actions = list(actions)
+        self.states = []
+
+    def get_action(self, game_state, hole_cards, legal_actions, min_bet, max_bet):
+        self.log.append((self.name, game_state.round_name))
+        self.states.append((game_state.snapshot(), min_bet, max_bet))
+        if self.actions:
+            return self.actions.pop(0)
+        if PlayerAction.CHECK in legal_actions:
+            return PlayerAction.CHECK, 0
+        return PlayerAction.CALL, 0
+
+
+def make_game(stacks, holes, board, scripts=None, small_blind=10, big_blind=20):
+    """
+    A game seated in the order of stacks (name -> chips) with the button on the first seat.
+    holes gives each player's hole cards and board the five community cards.
+    """
+    log = []
+    scripts = scripts or {}
+    bots = {name: ScriptedBot(name, log, *scripts.get(name, ())) for name in stacks}
+    game = PokerGame(bots, small_blind=small_blind, big_blind=big_blind)
+    game.player_chips.update(stacks)
+
+    dealt = cards(" ".join(holes[name] for name in stacks) + " " + board)
+    burns = [card for card in Deck().cards if card.code not in {c.code for c in dealt}][:3]
+    holes_dealt, flop, turn, river = dealt[:-5], dealt[-5:-2], dealt[-2], dealt[-1]
+    game.deck = StackedDeck(holes_dealt + [burns[0]] + flop + [burns[1], turn, burns[2], river])
+    return game, bots, log
+
+
+class SidePotTest(unittest.TestCase):
+
+    def play(self, game):
+        chips_before = sum(game.player_chips.values())
+        result = dict(game.play_hand())
+        self.assertEqual(sum(result.values()), chips_before)
+        self.assertEqual(game.pot, 0)
+        return result
+
+    def test_all_ins_at_different_stack_sizes(self):
+        # Button A, blinds B and C, D first to act; hands rank A > B > C > D
+        game, _, _ = make_game(
+            {"A": 100, "B": 300, "C": 1000, "D": 1000},
+            {"A": "Ac Ad", "B": "Kc Kd", "C": "Qc Qd", "D": "Th 6s"},
+            "2c 7d 9h Js 4c",
+            {"D": [(PlayerAction.ALL_IN, 0)], "A": [(PlayerAction.ALL_IN, 0)],
+             "B": [(PlayerAction.ALL_IN, 0)]})
+        result = self.play(game)
+        # Main pot 4 x 100, then 3 x 200 and 2 x 700 side pots
+        self.assertEqual(result, {"A": 400, "B": 600, "C": 1400, "D": 0})
+
+    def test_folded_chips_stay_in_the_pot(self):
+        # A is all-in; C calls pre-flop with the best hand and folds to B's flop bet
+        game, _, _ = make_game(
+            {"A": 150, "B": 1000, "C": 1000},
+            {"A": "Kc Kd", "B": "Qc Qd", "C": "Ac Ad"},
+            "2c 7d 9h Js 4s",
+            {"A": [(PlayerAction.ALL_IN, 0)], "B": [(PlayerAction.CALL, 0), (PlayerAction.RAISE, 300)],
+             "C": [(PlayerAction.CALL, 0), (PlayerAction.FOLD, 0)]})
+        result = self.play(game)
+        # A wins the 450 main pot including C's 150; B's uncalled 300 comes back
+        self.assertEqual(result, {"A": 450, "B": 850, "C": 850})
+
+    def test_side_pot_of_folded_players_goes_to_the_pot_below(self):
+        # A and B tie all-in for 100; C and D put in 325 and 300, then both fold
+        game, _, _ = make_game(
+            {"A": 100, "B": 100, "C": 1000, "D": 1000},
+            {"A": "Ac Kd", "B": "Ad Kc", "C": "7h 2s", "D": "8h 2d"},
+            "As Kh 9c 5d 3h",
+            {"D": [(PlayerAction.RAISE, 300), (PlayerAction.FOLD, 0)],
+             "A": [(PlayerAction.ALL_IN, 0)], "B": [(PlayerAction.ALL_IN, 0)],
+             "C": [(PlayerAction.CALL, 0), (PlayerAction.RAISE, 25), (PlayerAction.FOLD, 0)]})
+        result = self.play(game)
+        # 400 main pot, then 400 and 25 of dead money split between A and B
+        self.assertEqual(result, {"A": 413, "B": 412, "C": 675, "D": 700})
+
+    def test_odd_chip_goes_to_first_winner_in_seat_order(self):
+        # B and C hold the same two pair and split the 315 pot
+        game, _, _ = make_game(
+            {"A": 105, "B": 1000, "C": 1000},
+            {"A": "7h 2s", "B": "Ac Kd", "C": "Ad Kc"},
+            "As Kh 9c 5d 3h",
+            {"A": [(PlayerAction.ALL_IN, 0)]})
+        result = self.play(game)
+        self.assertEqual(result, {"A": 0, "B": 1000 - 105 + 158, "C": 1000 - 105 + 157})
+
+    def test_all_in_for_less_than_the_big_blind(self):
+        # C can only post 15 of the 20 big blind, and wins the 45 chip main pot
+        game, _, _ = make_game(
+            {"A": 1000, "B": 1000, "C": 15},
+            {"A": "Kc Kd", "B": "Qc Qd", "C": "Ac Ad"},
+            "2c 7d 9h Js 4s")
+        result = self.play(game)
+        # A takes the 2 x 5 side pot over B
+        self.assertEqual(result, {"A": 990, "B": 980, "C": 45})
+
+    def test_all_in_for_less_than_the_small_blind(self):
+        # B posts 5 of the 10 small blind and wins 3 x 5; A wins the 2 x 15 side pot
+        game, _, _ = make_game(
+            {"A": 1000, "B": 5, "C": 1000},
+            {"A": "Kc Kd", "B": "Ac Ad", "C": "Qc Qd"},
+            "2c 7d 9h Js 4s")
+        result = self.play(game)
+        self.assertEqual(result, {"A": 1010, "B": 15, "C": 980})
+
+
+class HeadsUpBettingTest(unittest.TestCase):
+    """Two players use _run_betting_round_hu; A has the button in every test"""
+
+    HOLES = {"A": "Kc Kd", "B": "Qc Qd"}
+    BOARD = "2c 7d 9h Js 4s"
+
+    def test_button_posts_small_blind_and_acts_first_preflop(self):
+        game, bots, log = make_game({"A": 1000, "B": 1000}, self.HOLES, self.BOARD)
+        result = dict(game.play_hand())
+        self.assertEqual(log, [("A", "preflop"), ("B", "preflop"),
+                               ("B", "flop"), ("A", "flop"),
+                               ("B", "turn"), ("A", "turn"),
+                               ("B", "river"), ("A", "river")])
+        state, min_bet, max_bet = bots["A"].states[0]
+        self.assertEqual(state.player_bets, {"A": 10, "B": 20})
+        self.assertEqual((state.pot, state.current_bet, min_bet, max_bet), (30, 20, 40, 1000))
+        self.assertEqual(result, {"A": 1020, "B": 980})
+
+    def test_raise_and_re_raise(self):
+        game, bots, log = make_game(
+            {"A": 1000, "B": 1000}, self.HOLES, self.BOARD,
+            {"A": [(PlayerAction.RAISE, 60)], "B": [(PlayerAction.RAISE, 180)]})
+        result = dict(game.play_hand())
+        self.assertEqual(log[:4], [("A", "preflop"), ("B", "preflop"), ("A", "preflop"), ("B", "flop")])
+        # B faces a raise of 40 and must re-raise to at least 100; A then faces 180 and 300
+        state, min_bet, _ = bots["B"].states[0]
+        self.assertEqual((state.current_bet, min_bet, state.pot), (60, 100, 80))
+        state, min_bet, _ = bots["A"].states[1]
+        self.assertEqual((state.current_bet, min_bet, state.pot), (180, 300, 240))
+        # A calls; the flop starts from a 360 pot with nothing to call
+        state, _, _ = bots["B"].states[1]
+        self.assertEqual((state.pot, state.current_bet), (360, 0))
+        self.assertEqual(result, {"A": 1180, "B": 820})
+
+    def test_all_in_call(self):
+        game, bots, log = make_game(
+            {"A": 1000, "B": 1000}, self.HOLES, self.BOARD,
+            {"A": [(PlayerAction.ALL_IN, 0)], "B": [(PlayerAction.CALL, 0)]})
+        result = dict(game.play_hand())
+        # Nobody has chips left to bet after the call
+        self.assertEqual(log, [("A", "preflop"), ("B", "preflop")])
+        self.assertEqual(len(game.community_cards), 5)
+        self.assertEqual(result, {"A": 2000, "B": 0})
+
+    def test_short_stack_calls_all_in_for_less(self):
+        game, _, log = make_game(
+            {"A": 1000, "B": 600}, {"A": "Kc Kd", "B": "Ac Ad"}, self.BOARD,
+            {"A": [(PlayerAction.ALL_IN, 0)], "B": [(PlayerAction.ALL_IN, 0)]})
+        result = dict(game.play_hand())
+        self.assertEqual(log, [("A", "preflop"), ("B", "preflop")])
+        # A's 400 that B could not cover comes back
+        self.assertEqual(result, {"A": 400, "B": 1200})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Tests for tournament table management
+Run from the repository root: python -m unittest discover -s tests
+"""
+import unittest
+
+from tournament import PokerTournament, TournamentSettings
+
+
+class RebalanceTest(unittest.TestCase):
+
+    def start(self, num_players, hands=13):
+        """A tournament some hands in, with the blinds raised once and the buttons moved"""
+        tournament = PokerTournament([f"bot{i}" for i in range(num_players)], TournamentSettings())
+        for _ in range(hands):
+            tournament.advance_hand()
+        for table in tournament.tables.values():
+            table.increase_blinds()
+            table.dealer_button = table.table_id + 1
+        return tournament
+
+    def bust(self, tournament, table_id, count):
+        for player in list(tournament.tables[table_id].active_players)[:count]:
+            tournament.eliminate_player(player)
+
+    def assert_continues(self, table, dealer_button):
+        self.assertEqual(table.current_blind_level, 2)
+        self.assertEqual(table.get_current_blinds(), (15, 30))
+        self.assertEqual(table.hands_played, 13)
+        self.assertEqual(table.dealer_button, dealer_button)
+
+    def test_blind_level_survives_rebalance(self):
+        tournament = self.start(18)
+        self.assertEqual(len(tournament.tables), 3)
+        self.bust(tournament, 3, 4)
+        self.assertTrue(tournament.should_rebalance_tables())
+
+        tournament.rebalance_tables()
+        self.assertEqual(sorted(len(table.players) for table in tournament.tables.values()), [4, 5, 5])
+        for table in tournament.tables.values():
+            self.assert_continues(table, table.table_id + 1)
+
+        # Blinds keep rising from the carried level
+        table = tournament.tables[1]
+        self.assertEqual(table.increase_blinds(), (22, 45))
+
+    def test_rebalance_to_one_table_continues_table_one(self):
+        tournament = self.start(12)
+        tournament.tables[2].dealer_button = 5
+        self.bust(tournament, 1, 5)
+        tournament.rebalance_tables()
+        self.assertEqual(list(tournament.tables), [1])
+        # Table 1 is replaced in place, though table 2 has more players left
+        self.assert_continues(tournament.tables[1], 2)
+
+    def test_final_table_keeps_the_fullest_tables_state(self):
+        tournament = self.start(12)
+        tournament.tables[2].dealer_button = 5
+        self.bust(tournament, 1, 5)
+        tournament.consolidate_to_final_table(tournament.get_active_players())
+        self.assertEqual(len(tournament.tables[1].players), 7)
+        self.assert_continues(tournament.tables[1], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,9 +2,9 @@
 Poker Tournament Management System
 Handles tournament structure, player elimination, and progression
 """
-import math
 import random
-from typing import List, Dict, Tuple, Optional
+import sys
+from typing import List, Dict, Set, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -27,10 +27,15 @@ class TournamentSettings:
     max_players_per_table: int = 6
     min_players_per_table: int = 2
     time_limit_per_action: float = 10.0  # seconds
+    isolate_bots: bool = False  # run each bot in its own killable process
     max_hands_per_level: int = 50
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older versions get a regular one
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class PlayerStats:
     name: str
     chips: int = 0
@@ -51,21 +56,24 @@ class TournamentTable:
         self.players = players.copy()
         self.settings = settings
         self.eliminated_players: List[str] = []
+        self.active_players: List[str] = players.copy()  # players minus eliminated_players, in seat order
         self.hands_played = 0
         self.current_blind_level = 1
+        self.small_blind, self.big_blind = self._blinds_for_level(1)  # updated by increase_blinds
         self.dealer_button: int = 0
         
         self.logger = logging.getLogger(f"tournament.table_{table_id}")
         
     def get_active_players(self) -> List[str]:
-        """Get list of players still active at this table"""
-        return [p for p in self.players if p not in self.eliminated_players]
+        """Get list of players still active at this table (kept up to date, don't modify it)"""
+        return self.active_players
     
     def eliminate_player(self, player: str, hand_number: int):
         """Eliminate a player from this table"""
-        if player in self.players and player not in self.eliminated_players:
+        if player in self.active_players:
             self.eliminated_players.append(player)
-            self.logger.info(f"Player {player} eliminated from table {self.table_id} on hand {hand_number}")
+            self.active_players.remove(player)
+            self.logger.info("Player %s eliminated from table %d on hand %d", player, self.table_id, hand_number)
     
     def should_increase_blinds(self) -> bool:
         """Check if blinds should be increased"""
@@ -74,21 +82,24 @@ class TournamentTable:
     def increase_blinds(self):
         """Increase the blind levels"""
         self.current_blind_level += 1
-        new_small = int(self.settings.small_blind * (self.settings.blind_increase_factor ** (self.current_blind_level - 1)))
-        new_big = int(self.settings.big_blind * (self.settings.blind_increase_factor ** (self.current_blind_level - 1)))
+        self.small_blind, self.big_blind = self._blinds_for_level(self.current_blind_level)
         
-        self.logger.info(f"Table {self.table_id} blinds increased to {new_small}/{new_big} (Level {self.current_blind_level})")
-        return new_small, new_big
+        self.logger.info("Table %d blinds increased to %d/%d (Level %d)",
+                         self.table_id, self.small_blind, self.big_blind, self.current_blind_level)
+        return self.small_blind, self.big_blind
     
     def get_current_blinds(self) -> Tuple[int, int]:
         """Get current blind levels for this table"""
-        small = int(self.settings.small_blind * (self.settings.blind_increase_factor ** (self.current_blind_level - 1)))
-        big = int(self.settings.big_blind * (self.settings.blind_increase_factor ** (self.current_blind_level - 1)))
-        return small, big
+        return self.small_blind, self.big_blind
+    
+    def _blinds_for_level(self, level: int) -> Tuple[int, int]:
+        """Small and big blind at a blind level (level 1 = the starting blinds)"""
+        multiplier = self.settings.blind_increase_factor ** (level - 1)
+        return int(self.settings.small_blind * multiplier), int(self.settings.big_blind * multiplier)
     
     def is_ready_to_break(self) -> bool:
         """Check if table should be broken up (too few players)"""
-        return len(self.get_active_players()) < self.settings.min_players_per_table
+        return len(self.active_players) < self.settings.min_players_per_table
 
 
 class PokerTournament:
@@ -100,8 +111,11 @@ class PokerTournament:
         
         # Tournament state
         self.tables: Dict[int, TournamentTable] = {}
+        self._player_tables: Dict[str, TournamentTable] = {}  # player -> table they are seated at
+        self._rebalance_needed: Optional[bool] = None  # cached should_rebalance_tables, None = stale
         self.player_stats: Dict[str, PlayerStats] = {}
         self.eliminated_players: List[str] = []
+        self.remaining_players: Set[str] = set(players)  # everyone not yet eliminated
         self.current_hand = 0
         self.tournament_complete = False
         
@@ -119,33 +133,45 @@ class PokerTournament:
         """Set up initial tournament tables"""
         random.shuffle(self.players)  # Randomize seating
         
-        players_per_table = min(self.settings.max_players_per_table, 
-                               max(self.settings.min_players_per_table,
-                                   len(self.players) // self.calculate_optimal_table_count()))
-        
-        table_id = 1
-        for i in range(0, len(self.players), players_per_table):
-            table_players = self.players[i:i + players_per_table]
-            if len(table_players) >= self.settings.min_players_per_table:
-                self.tables[table_id] = TournamentTable(table_id, table_players, self.settings)
-                table_id += 1
-            else:
-                # Distribute remaining players to existing tables
-                for j, player in enumerate(table_players):
-                    target_table = (j % (table_id - 1)) + 1
-                    self.tables[target_table].players.append(player)
+        # Split the field into balanced tables: sizes differ by at most one player,
+        # with the larger tables first
+        if self.players:
+            num_tables = self.calculate_optimal_table_count()
+            base_size, larger_tables = divmod(len(self.players), num_tables)
+            start = 0
+            for i in range(num_tables):
+                size = base_size + (1 if i < larger_tables else 0)
+                self._open_table(i + 1, self.players[start:start + size])
+                start += size
         
         self.logger.info(f"Tournament setup with {len(self.tables)} tables")
         for table_id, table in self.tables.items():
             self.logger.info(f"Table {table_id}: {table.players}")
     
+    def _open_table(self, table_id: int, players: List[str],
+                    replaces: Optional[TournamentTable] = None) -> TournamentTable:
+        """
+        Create a table, add it to the tournament and index its players. A table opened
+        in place of an old one keeps its blind level, hand count and dealer button.
+        """
+        table = self.tables[table_id] = TournamentTable(table_id, players, self.settings)
+        if replaces is not None:
+            table.hands_played = replaces.hands_played
+            table.current_blind_level = replaces.current_blind_level
+            table.small_blind, table.big_blind = replaces.small_blind, replaces.big_blind
+            table.dealer_button = replaces.dealer_button
+        for player in table.players:
+            self._player_tables[player] = table
+        self._rebalance_needed = None
+        return table
+    
     def calculate_optimal_table_count(self) -> int:
         """Calculate optimal number of tables"""
         if len(self.players) <= self.settings.max_players_per_table:
             return 1
         
         # Try to balance table sizes
-        optimal_count = math.ceil(len(self.players) / self.settings.max_players_per_table)
+        optimal_count = -(-len(self.players) // self.settings.max_players_per_table)  # integer ceil
         
         # Ensure no table has too few players
         while optimal_count > 1:
@@ -160,32 +186,33 @@ class PokerTournament:
         """Get all active players across all tables"""
         active = []
         for table in self.tables.values():
-            active.extend(table.get_active_players())
+            active.extend(table.active_players)
         return active
     
     def eliminate_player(self, player: str, final_chips: int = 0):
         """Eliminate a player from the tournament"""
-        if player in self.eliminated_players:
+        if player not in self.remaining_players:
             return
         
         self.eliminated_players.append(player)
+        self.remaining_players.discard(player)
+        self._rebalance_needed = None
         self.player_stats[player].chips = final_chips
         self.player_stats[player].is_eliminated = True
         self.player_stats[player].elimination_hand = self.current_hand
         self.player_stats[player].position = len(self.players) - len(self.eliminated_players) + 1
         
         # Remove from table
-        for table in self.tables.values():
-            if player in table.players:
-                table.eliminate_player(player, self.current_hand)
-                break
+        table = self._player_tables.get(player)
+        if table is not None:
+            table.eliminate_player(player, self.current_hand)
         
-        self.logger.info(f"Player {player} eliminated in position {self.player_stats[player].position}")
+        self.logger.info("Player %s eliminated in position %d", player, self.player_stats[player].position)
         
         # Check if tournament is complete
-        if len(self.get_active_players()) <= 1:
+        if len(self.remaining_players) <= 1:
             self.tournament_complete = True
-            if self.get_active_players():
+            if self.remaining_players:
                 winner = self.get_active_players()[0]
                 self.player_stats[winner].position = 1
                 self.logger.info(f"Tournament complete! Winner: {winner}")
@@ -197,9 +224,23 @@ class PokerTournament:
             self.player_stats[player].chips = new_chip_count
             
             # Check for elimination
-            if new_chip_count <= 0 and player not in self.eliminated_players:
+            if new_chip_count <= 0 and player in self.remaining_players:
                 self.eliminate_player(player, 0)
     
+    def update_chips_bulk(self, chips: Dict[str, int]):
+        """Update several players' chip counts at once (e.g. a table after a hand), then eliminate the busted ones in order"""
+        player_stats = self.player_stats
+        busted = []
+        for player, new_chip_count in chips.items():
+            stats = player_stats.get(player)
+            if stats is not None:
+                stats.chips = new_chip_count
+                if new_chip_count <= 0:
+                    busted.append(player)
+        
+        for player in busted:
+            self.eliminate_player(player, 0)
+    
     def record_hand_result(self, player: str, won: bool, winnings: int = 0):
         """Record the result of a hand for a player"""
         if player in self.player_stats:
@@ -211,36 +252,52 @@ class PokerTournament:
                 stats.biggest_pot_won = max(stats.biggest_pot_won, winnings)
     
     def should_rebalance_tables(self) -> bool:
-        """Check if tables need rebalancing based on stricter criteria."""
-        active_players = self.get_active_players()
-        active_tables = [t for t in self.tables.values() if len(t.get_active_players()) > 0]
+        """
+        Check if tables need rebalancing based on stricter criteria.
+        Seating only changes on eliminations and rebalances, so the answer is kept until then.
+        """
+        if self._rebalance_needed is None:
+            self._rebalance_needed = self._check_rebalance()
+        return self._rebalance_needed
+    
+    def _check_rebalance(self) -> bool:
+        """Evaluate the rebalancing rules against the current tables"""
+        # One pass over the tables that still have players: how many, how many players,
+        # and the smallest and largest table
+        num_tables = num_active = largest = 0
+        smallest = len(self.players)  # no table can hold more than the whole field
+        for table in self.tables.values():
+            size = len(table.active_players)
+            if size:
+                num_tables += 1
+                num_active += size
+                if size < smallest:
+                    smallest = size
+                if size > largest:
+                    largest = size
         
         # If all active players can fit on one table, and there's more than one table, consolidate.
-        if len(active_players) <= self.settings.max_players_per_table and len(active_tables) > 1:
+        if num_active <= self.settings.max_players_per_table and num_tables > 1:
             return True
         
-        if len(active_tables) <= 1:
+        if num_tables <= 1:
             return False
-        
-        table_sizes = [len(t.get_active_players()) for t in active_tables]
 
         # Trigger if any table is "ready to break" (e.g., < min_players_per_table, which is 2 by default)
-        for table in active_tables:
-            if table.is_ready_to_break():
-                return True
+        if smallest < self.settings.min_players_per_table:
+            return True
         
         # User's specific rule: If total active players >= 4, no table should have < 4 players.
         # This check should only trigger if it's actually possible to form tables of 4+.
-        if len(active_players) >= 4:
-            if any(size < 4 for size in table_sizes):
-                # Calculate if it's possible to form tables of 4+
-                # Find the maximum number of tables that could be formed with 4 players each
-                max_tables_at_4 = len(active_players) // 4
-                if max_tables_at_4 >= len(active_tables): # If we can form all tables with 4+ players, rebalance
-                     return True
+        if num_active >= 4 and smallest < 4:
+            # Calculate if it's possible to form tables of 4+
+            # Find the maximum number of tables that could be formed with 4 players each
+            max_tables_at_4 = num_active // 4
+            if max_tables_at_4 >= num_tables: # If we can form all tables with 4+ players, rebalance
+                return True
 
         # Check for significant imbalance (difference of more than 1 player between tables)
-        if len(table_sizes) > 1 and max(table_sizes) - min(table_sizes) > 1:
+        if largest - smallest > 1:
             return True
         
         return False
@@ -250,8 +307,14 @@ class PokerTournament:
         self.logger.info("Rebalancing tables...")
         active_players = self.get_active_players()
         
+        # New tables continue from the old table with the same id, or else the fullest one
+        previous_tables = dict(self.tables)
+        fullest_table = self._fullest_table()
+        
         # Clear all existing tables
         self.tables.clear()
+        self._player_tables.clear()
+        self._rebalance_needed = None
         
         # Re-distribute all active players from scratch
         random.shuffle(active_players) # Shuffle to randomize seating again
@@ -264,7 +327,7 @@ class PokerTournament:
 
         if num_players <= self.settings.max_players_per_table:
             # All players fit on one table (final table or early game)
-            self.tables[1] = TournamentTable(1, active_players, self.settings)
+            self._open_table(1, active_players, previous_tables.get(1, fullest_table))
             self.logger.info(f"Consolidated to single table with {num_players} players.")
             return
 
@@ -276,7 +339,7 @@ class PokerTournament:
         # Try to make tables as full as possible without exceeding max_players_per_table
         # And keeping above min_players_per_table_target
         
-        num_tables = math.ceil(num_players / self.settings.max_players_per_table)
+        num_tables = -(-num_players // self.settings.max_players_per_table)  # integer ceil
         
         # Adjust num_tables to avoid having tables smaller than min_players_per_table_target if possible
         while num_tables > 1 and (num_players / num_tables) < min_players_per_table_target:
@@ -300,7 +363,7 @@ class PokerTournament:
                 self.logger.warning(f"Attempted to create table with fewer than min_players_per_table: {len(table_players_subset)}")
                 if len(table_players_subset) == 0: continue # Don't create empty tables
             
-            self.tables[table_id] = TournamentTable(table_id, table_players_subset, self.settings)
+            self._open_table(table_id, table_players_subset, previous_tables.get(table_id, fullest_table))
             self.logger.info(f"Table {table_id}: {len(table_players_subset)} players: {', '.join(table_players_subset)}")
             current_player_idx += players_on_this_table
         
@@ -308,23 +371,31 @@ class PokerTournament:
     
     def consolidate_to_final_table(self, players: List[str]):
         """Move all remaining players to a single final table"""
+        fullest_table = self._fullest_table()
         self.tables.clear()
-        self.tables[1] = TournamentTable(1, players, self.settings)
+        self._player_tables.clear()
+        self._open_table(1, players, fullest_table)
         self.logger.info(f"Consolidated to final table with {len(players)} players")
     
+    def _fullest_table(self) -> Optional[TournamentTable]:
+        """The table with the most active players, or None if there are no tables"""
+        return max(self.tables.values(), key=lambda table: len(table.active_players), default=None)
+    
     def get_tournament_status(self) -> Dict[str, any]:
         """Get current tournament status"""
         active_players = self.get_active_players()
+        # One pass over the stacks for both the chip leader and the average stack
+        chips = {player: self.player_stats[player].chips for player in active_players}
         
         return {
             'hand_number': self.current_hand,
             'total_players': len(self.players),
             'active_players': len(active_players),
             'eliminated_players': len(self.eliminated_players),
-            'active_tables': len([t for t in self.tables.values() if len(t.get_active_players()) > 0]),
+            'active_tables': len([t for t in self.tables.values() if t.active_players]),
             'tournament_complete': self.tournament_complete,
-            'chip_leader': self.get_chip_leader(),
-            'average_stack': self.get_average_stack(),
+            'chip_leader': max(chips, key=chips.__getitem__) if chips else None,
+            'average_stack': sum(chips.values()) // len(chips) if chips else 0,
             'players_remaining': active_players
         }
     
@@ -334,7 +405,8 @@ class PokerTournament:
         if not active_players:
             return None
         
-        return max(active_players, key=lambda p: self.player_stats[p].chips)
+        chips = {player: self.player_stats[player].chips for player in active_players}
+        return max(chips, key=chips.__getitem__)
     
     def get_average_stack(self) -> int:
         """Get the average chip stack of active players"""
@@ -347,22 +419,17 @@ class PokerTournament:
     
     def get_leaderboard(self) -> List[Tuple[str, int, int]]:
         """Get current leaderboard (name, chips, position)"""
-        leaderboard = []
+        stats = self.player_stats
         
         # Active players sorted by chips
-        active_players = self.get_active_players()
-        active_sorted = sorted(active_players, key=lambda p: self.player_stats[p].chips, reverse=True)
-        
-        for i, player in enumerate(active_sorted):
-            leaderboard.append((player, self.player_stats[player].chips, i + 1))
-        
-        # Eliminated players by elimination order (reverse)
-        eliminated_sorted = sorted(self.eliminated_players, 
-                                 key=lambda p: self.player_stats[p].position)
-        
-        for player in eliminated_sorted:
-            leaderboard.append((player, self.player_stats[player].chips, self.player_stats[player].position))
-        
+        chips = {player: stats[player].chips for player in self.get_active_players()}
+        active_sorted = sorted(chips, key=chips.__getitem__, reverse=True)
+        leaderboard = [(player, chips[player], i + 1) for i, player in enumerate(active_sorted)]
+        
+        # Eliminated players by elimination order (reverse): each elimination takes the next
+        # better position, so the latest one out has the best position
+        leaderboard.extend((player, stats[player].chips, stats[player].position)
+                           for player in reversed(self.eliminated_players))
         return leaderboard
     
     def advance_hand(self):
@@ -375,7 +442,7 @@ class PokerTournament:
     
     def is_tournament_complete(self) -> bool:
         """Check if tournament is complete"""
-        return self.tournament_complete or len(self.get_active_players()) <= 1
+        return self.tournament_complete or len(self.remaining_players) <= 1
     
     def get_final_results(self) -> List[Tuple[str, int, int]]:
         """Get final tournament results"""
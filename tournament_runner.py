@@ -4,6 +4,7 @@ Orchestrates the entire poker tournament from start to finish
 """
 import sys
 import logging
+import logging.handlers
 import time
 import random
 from typing import List, Dict, Any, Optional
@@ -17,10 +18,11 @@ from tournament import PokerTournament, TournamentSettings, TournamentType
 from bot_manager import BotManager
 
 
-
 class TournamentRunner:
     """Main class that runs the entire poker tournament"""
     
+    LOG_BUFFER_RECORDS = 200  # log records held in memory before they are written to the file
+    
     def __init__(self, settings: TournamentSettings = None, 
                  players_directory: str = "players",
                  log_directory: str = "logs"):
@@ -30,7 +32,8 @@ class TournamentRunner:
         self.log_directory = log_directory
         
         # Core components
-        self.bot_manager = BotManager(players_directory, self.settings.time_limit_per_action)
+        self.bot_manager = BotManager(players_directory, self.settings.time_limit_per_action,
+                                      self.settings.isolate_bots)
         self.tournament: Optional[PokerTournament] = None
         self.current_games: Dict[int, PokerGame] = {}  # table_id -> game
         
@@ -42,6 +45,16 @@ class TournamentRunner:
         self.setup_logging()
         self.logger = logging.getLogger("tournament_runner")
     
+    def reset_state(self):
+        """
+        Clear per-tournament state so this runner can run another tournament.
+        Loaded bot modules are kept; bots themselves are re-instantiated by run_tournament.
+        """
+        self.tournament = None
+        self.current_games = {}  # games hold the previous tournament's bot wrappers
+        self.tournament_results = {}
+        self.hand_histories = []
+    
     def setup_logging(self):
         """Configure logging for the tournament"""
         # Ensure stdout handles UTF-8 (fixes Windows emoji issues)
@@ -55,23 +68,33 @@ class TournamentRunner:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_filename = os.path.join(self.log_directory, f"tournament_{timestamp}.log")
         
-        # Configure logging
+        # Configure logging: everything goes to the log file, only warnings and errors
+        # also go to the console (the final results are printed separately)
+        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        file_handler = logging.FileHandler(log_filename, encoding='utf-8', delay=True)  # created on the first record
+        file_handler.setFormatter(logging.Formatter(log_format))
+        # The file is written in batches of records; a warning or error writes out the batch at once
+        self._log_buffer = logging.handlers.MemoryHandler(
+            self.LOG_BUFFER_RECORDS, flushLevel=logging.WARNING, target=file_handler)
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.WARNING)
         logging.basicConfig(
             level=logging.DEBUG,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            format=log_format,
             handlers=[
-                logging.FileHandler(log_filename, encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)  # Also log to console
+                self._log_buffer,
+                console_handler
             ]
         )
     
-    def run_tournament(self) -> Dict[str, Any]:
+    def run_tournament(self, save_results: bool = True) -> Dict[str, Any]:
         """
         Run the complete tournament from start to finish
-        Returns final results dictionary
+        Returns final results dictionary (also written to the log directory if save_results)
         """
         self.logger.info("Starting poker tournament...")
         start_time = time.time()
+        self.reset_state()
         
         try:
             # Load all bots
@@ -112,7 +135,8 @@ class TournamentRunner:
                 'bot_stats': self.bot_manager.get_bot_stats(),
             }
             
-            self.save_tournament_results()
+            if save_results:
+                self.save_tournament_results()
             self.print_final_results()
             
             return self.tournament_results
@@ -122,6 +146,8 @@ class TournamentRunner:
             raise
         finally:
             self.bot_manager.cleanup()
+            # Write out buffered log records however the tournament ended
+            self._log_buffer.flush()
     
     def run_tournament_round(self):
         """Run one round of hands across all active tables"""
@@ -132,24 +158,31 @@ class TournamentRunner:
             return
         
         # Start games on all active tables
+        previous_games = self.current_games
         self.current_games = {}
+        all_bots = self.bot_manager.bots
         for table_id, table in active_tables.items():
             player_ids = table.get_active_players()
             if len(player_ids) >= 2:
-                small_blind, big_blind = table.get_current_blinds()
+                chips = {player: self.tournament.player_stats[player].chips for player in player_ids}
+                dealer_button_index = table.dealer_button % len(player_ids)
                 
-                bots = {pid: self.bot_manager.get_bot(pid) for pid in player_ids}
+                game = previous_games.get(table_id)
+                if game is not None and game.player_ids == player_ids:
+                    # Same seats as last hand: reuse the game instead of rebuilding it
+                    game.reset_for_next_hand(chips, table.small_blind, table.big_blind, dealer_button_index)
+                else:
+                    bots = {pid: all_bots.get(pid) for pid in player_ids}
 
-                # Create poker game for this table
-                game = PokerGame(bots, 
-                               starting_chips=0,  # Will use tournament chip counts
-                               small_blind=small_blind, 
-                               big_blind=big_blind,
-                               dealer_button_index=table.dealer_button % len(player_ids))
-                
-                # Set actual chip counts from tournament
-                for player in player_ids:
-                    game.player_chips[player] = self.tournament.player_stats[player].chips
+                    # Create poker game for this table
+                    game = PokerGame(bots, 
+                                   starting_chips=0,  # Will use tournament chip counts
+                                   small_blind=table.small_blind, 
+                                   big_blind=table.big_blind,
+                                   dealer_button_index=dealer_button_index)
+                    
+                    # Set actual chip counts from tournament
+                    game.player_chips.update(chips)
                 
                 self.current_games[table_id] = game
         
@@ -166,24 +199,22 @@ class TournamentRunner:
     
     def play_single_hand(self, table_id: int, game: PokerGame):
         """Play a single hand of poker on one table"""
-        self.logger.info(f"Starting hand #{self.tournament.current_hand + 1} on table {table_id}")
+        self.logger.info("Starting hand #%d on table %d", self.tournament.current_hand + 1, table_id)
         
         try:
             # The game loop is now handled by the PokerGame itself
             final_chips = game.play_hand()
 
-            # Check for disqualified bots and remove their chips
-            for player_id in list(final_chips.keys()):
-                bot = self.bot_manager.get_bot(player_id)
+            # Check for disqualified bots and remove their chips (the game holds this table's bots)
+            for player_id, bot in game.player_bots.items():
                 if bot and bot.is_disqualified():
-                    self.logger.info(f"Bot {player_id} disqualified. Removing remaining chips ({final_chips[player_id]}).")
+                    self.logger.info("Bot %s disqualified. Removing remaining chips (%d).", player_id, final_chips[player_id])
                     final_chips[player_id] = 0
 
             # Update tournament chip counts from the game's final state
-            for player_id, chips in final_chips.items():
-                self.tournament.update_player_chips(player_id, chips)
+            self.tournament.update_chips_bulk(final_chips)
 
-            self.logger.info(f"Hand #{self.tournament.current_hand + 1} complete on table {table_id}")
+            self.logger.info("Hand #%d complete on table %d", self.tournament.current_hand + 1, table_id)
 
         except Exception as e:
             self.logger.error(f"Error in hand on table {table_id}: {str(e)}")
@@ -199,27 +230,14 @@ class TournamentRunner:
         results_file = os.path.join(self.log_directory, f"results_{timestamp}.json")
         
         try:
-            # Convert results to JSON-serializable format
-            serializable_results = self._make_json_serializable(self.tournament_results)
-            
+            # Anything JSON can't represent natively is written as its string form
             with open(results_file, 'w') as f:
-                json.dump(serializable_results, f, indent=2)
+                json.dump(self.tournament_results, f, indent=2, default=str)
             
             self.logger.info(f"Tournament results saved to {results_file}")
         except Exception as e:
             self.logger.error(f"Error saving results: {str(e)}")
     
-    def _make_json_serializable(self, data):
-        """Convert data to JSON-serializable format"""
-        if isinstance(data, dict):
-            return {k: self._make_json_serializable(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._make_json_serializable(item) for item in data]
-        elif isinstance(data, (str, int, float, bool, type(None))):
-            return data
-        else:
-            return str(data)
-    
     def print_final_results(self):
         """Print formatted final results"""
         if not self.tournament_results:
@@ -272,6 +290,8 @@ def main():
                        help='Time limit per action in seconds')
     parser.add_argument('--blind-increase', type=int, default=10,
                        help='Hands between blind increases')
+    parser.add_argument('--isolate-bots', action='store_true',
+                       help='Run each bot in its own process so timeouts can be enforced by killing it')
     
     args = parser.parse_args()
     
@@ -282,7 +302,8 @@ def main():
         small_blind=args.small_blind,
         big_blind=args.big_blind,
         time_limit_per_action=args.time_limit,
-        blind_increase_interval=args.blind_increase
+        blind_increase_interval=args.blind_increase,
+        isolate_bots=args.isolate_bots
     )
     
     # Run tournament